@@ -1,6 +1,7 @@
 """Data models for analyzers."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List
 
 from mcp_builder.mcp.schemas import ProjectStatus, ProjectType
@@ -14,4 +15,14 @@ class TechnicalSignals:
     project_type: ProjectType
     maturity: ProjectStatus
     activity_level: str  # 'high', 'medium', 'low'
-    tech_stack: List[str]
\ No newline at end of file
+    tech_stack: List[str]
+
+    @cached_property
+    def languages_csv(self) -> str:
+        """Comma-joined languages, cached for repeated prompt builds."""
+        return ', '.join(self.languages)
+
+    @cached_property
+    def frameworks_csv(self) -> str:
+        """Comma-joined frameworks, cached for repeated prompt builds."""
+        return ', '.join(self.frameworks)
\ No newline at end of file
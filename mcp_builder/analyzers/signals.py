@@ -1,13 +1,23 @@
 """Signal extraction engine."""
 
 import logging
-from datetime import datetime, timedelta
-from typing import List
+import re
+from datetime import datetime, timedelta, timezone
+from typing import List, TYPE_CHECKING
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from .models import TechnicalSignals
 from ..ingestion.models import FileContent, GitCommit
 from ..mcp.schemas import ProjectStatus, ProjectType
 
+if TYPE_CHECKING:
+    from ..ingestion.models import RepositorySnapshot
+
 logger = logging.getLogger(__name__)
 
 # Language mapping from file extensions
@@ -49,86 +59,165 @@ FRAMEWORK_KEYWORDS = {
     'numpy': 'NumPy',
 }
 
+# Output orders fixed at module load; filtering against them yields
+# already-sorted results without a per-call set -> list -> sort round trip.
+_LANGUAGE_ORDER = sorted(set(LANGUAGE_EXTENSIONS.values()))
+_FRAMEWORK_ORDER = sorted(set(FRAMEWORK_KEYWORDS.values()))
+_TECH_STACK_ORDER = sorted(set(_LANGUAGE_ORDER) | set(_FRAMEWORK_ORDER))
+
+# Files whose dependency lists are scanned for framework keywords
+DEPENDENCY_FILE_NAMES = {'requirements.txt', 'pyproject.toml', 'package.json'}
+
+# Source suffixes scanned for framework imports
+IMPORT_SCAN_SUFFIXES = {'.py', '.js', '.ts'}
+
+
+def _build_framework_automaton():
+    """Build a single Aho-Corasick automaton over all framework needles.
+
+    Each needle carries a (kind, name) payload so one scan of the content
+    can serve both dependency-file and import matching.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword, name in FRAMEWORK_KEYWORDS.items():
+        automaton.add_word(keyword, ('dep', name))
+        automaton.add_word(f'import {keyword}', ('imp', name))
+        automaton.add_word(f'from {keyword}', ('imp', name))
+    automaton.make_automaton()
+    return automaton
+
+
+_FRAMEWORK_AUTOMATON = _build_framework_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Case-insensitive patterns matched against the original content, so no
+# lowercased copy of each file needs to be allocated.
+_KEYWORD_ALTERNATION = '|'.join(map(re.escape, FRAMEWORK_KEYWORDS))
+_DEPENDENCY_PATTERN = re.compile(rf'\b({_KEYWORD_ALTERNATION})\b', re.IGNORECASE)
+_IMPORT_PATTERN = re.compile(rf'\b(?:import|from)\s+({_KEYWORD_ALTERNATION})\b', re.IGNORECASE)
+
 
 def extract_languages(files: List[FileContent]) -> List[str]:
     """Extract programming languages from file extensions."""
-    languages = set()
-    for file in files:
-        ext = file.path.suffix.lower()
-        if ext in LANGUAGE_EXTENSIONS:
-            languages.add(LANGUAGE_EXTENSIONS[ext])
-    return sorted(list(languages))
+    # Dedupe suffixes first so the language lookup runs once per distinct
+    # extension (a C-level set intersection) rather than once per file.
+    suffixes = {file.suffix_lower for file in files}
+    found = {LANGUAGE_EXTENSIONS[s] for s in LANGUAGE_EXTENSIONS.keys() & suffixes}
+    return [name for name in _LANGUAGE_ORDER if name in found]
+
+
+def _collect_frameworks(dependency_files: List[FileContent], code_files: List[FileContent]) -> set:
+    """Collect framework names with one scan per file group.
+
+    The group's contents are joined with a NUL sentinel (absent from the
+    pattern alphabet) so a single automaton/regex pass covers all files
+    without matching across file boundaries.
+    """
+    frameworks = set()
+    if _FRAMEWORK_AUTOMATON is not None:
+        for group, wanted in ((dependency_files, 'dep'), (code_files, 'imp')):
+            if group:
+                buffer = '\0'.join(f.content.lower() for f in group)
+                for _, (kind, name) in _FRAMEWORK_AUTOMATON.iter(buffer):
+                    if kind == wanted:
+                        frameworks.add(name)
+    else:
+        if dependency_files:
+            buffer = '\0'.join(f.content for f in dependency_files)
+            for match in _DEPENDENCY_PATTERN.finditer(buffer):
+                frameworks.add(FRAMEWORK_KEYWORDS[match.group(1).lower()])
+        if code_files:
+            buffer = '\0'.join(f.content for f in code_files)
+            for match in _IMPORT_PATTERN.finditer(buffer):
+                frameworks.add(FRAMEWORK_KEYWORDS[match.group(1).lower()])
+    return frameworks
 
 
 def extract_frameworks(files: List[FileContent]) -> List[str]:
     """Extract frameworks from dependencies and imports."""
-    frameworks = set()
+    dependency_files = []
+    code_files = []
     for file in files:
-        content_lower = file.content.lower()
-        # Check config files
-        if file.path.name.lower() in ['requirements.txt', 'pyproject.toml', 'package.json']:
-            for keyword, name in FRAMEWORK_KEYWORDS.items():
-                if keyword in content_lower:
-                    frameworks.add(name)
-        # Check code files for imports
-        elif file.path.suffix.lower() in ['.py', '.js', '.ts']:
-            for keyword, name in FRAMEWORK_KEYWORDS.items():
-                if f'import {keyword}' in content_lower or f'from {keyword}' in content_lower:
-                    frameworks.add(name)
-    return sorted(list(frameworks))
+        if file.name_lower in DEPENDENCY_FILE_NAMES:
+            dependency_files.append(file)
+        elif file.suffix_lower in IMPORT_SCAN_SUFFIXES:
+            code_files.append(file)
+    found = _collect_frameworks(dependency_files, code_files)
+    return [name for name in _FRAMEWORK_ORDER if name in found]
 
 
 def infer_project_type(files: List[FileContent]) -> ProjectType:
     """Infer project type from file structure and content."""
-    paths = [str(f.path).lower() for f in files]
-    file_names = [f.path.name.lower() for f in files]
+    is_api = is_web = is_ml = is_automation = is_library = False
 
-    # CLI indicators
-    if any('cli' in p or 'main.py' in n or 'main.js' in n for p, n in zip(paths, file_names)):
-        return ProjectType.CLI
+    # Single pass over the files; indicator precedence is resolved after the
+    # loop, and a CLI hit exits immediately since nothing outranks it.
+    for file in files:
+        p = file.path_lower
+        n = file.name_lower
 
-    # API indicators
-    if any('api' in p or 'app.py' in n or 'server.js' in n for p, n in zip(paths, file_names)):
-        return ProjectType.API
+        if 'cli' in p or 'main.py' in n or 'main.js' in n:
+            return ProjectType.CLI
 
-    # Web app indicators
-    if any('web' in p or 'index.html' in n for p, n in zip(paths, file_names)):
-        return ProjectType.WEB_APP
+        is_api = is_api or 'api' in p or 'app.py' in n or 'server.js' in n
+        is_web = is_web or 'web' in p or 'index.html' in n
+        is_ml = is_ml or 'ml' in p or 'model' in p
+        is_automation = is_automation or 'script' in p or 'automation' in p
+        is_library = is_library or 'lib' in p or 'library' in p
 
-    # ML indicators
-    if any('ml' in p or 'model' in p for p in paths):
+    if is_api:
+        return ProjectType.API
+    if is_web:
+        return ProjectType.WEB_APP
+    if is_ml:
         return ProjectType.ML
-
-    # Automation indicators
-    if any('script' in p or 'automation' in p for p in paths):
+    if is_automation:
         return ProjectType.AUTOMATION
-
-    # Library indicators
-    if any('lib' in p or 'library' in p for p in paths):
+    if is_library:
         return ProjectType.LIBRARY
-
     return ProjectType.OTHER
 
 
+# Indicator bits accumulated by infer_maturity
+_HAS_TESTS = 1
+_HAS_CI = 2
+_HAS_DOCS = 4
+_HAS_VERSION = 8
+_ALL_INDICATORS = _HAS_TESTS | _HAS_CI | _HAS_DOCS | _HAS_VERSION
+
+
 def infer_maturity(files: List[FileContent], commits: List[GitCommit]) -> ProjectStatus:
     """Infer project maturity from structure and activity."""
-    has_tests = any('test' in str(f.path).lower() for f in files)
-    has_ci = any('ci' in str(f.path).lower() or '.github' in str(f.path).lower() for f in files)
-    has_docs = any('doc' in str(f.path).lower() or 'readme' in str(f.path).lower() for f in files)
-    has_version = any('version' in f.path.name.lower() for f in files)
+    mask = 0
+    for f in files:
+        p = f.path_lower
+        if 'test' in p:
+            mask |= _HAS_TESTS
+        if 'ci' in p or '.github' in p:
+            mask |= _HAS_CI
+        if 'doc' in p or 'readme' in p:
+            mask |= _HAS_DOCS
+        if 'version' in f.name_lower:
+            mask |= _HAS_VERSION
+        if mask == _ALL_INDICATORS:
+            break
 
     # Production: tests, CI, docs, version
-    if has_tests and has_ci and has_docs and has_version:
+    if mask == _ALL_INDICATORS:
         return ProjectStatus.PRODUCTION
 
     # MVP: tests and docs
-    if has_tests and has_docs:
+    if mask & _HAS_TESTS and mask & _HAS_DOCS:
         return ProjectStatus.MVP
 
     # Prototype: default
     return ProjectStatus.PROTOTYPE
 
 
+# Activity buckets compared as timedeltas, avoiding the .days truncation
+_HIGH_ACTIVITY_WINDOW = timedelta(days=30)
+_MEDIUM_ACTIVITY_WINDOW = timedelta(days=90)
+
+
 def infer_activity_level(commits: List[GitCommit]) -> str:
     """Infer activity level from commit recency."""
     if not commits:
@@ -136,20 +225,16 @@ def infer_activity_level(commits: List[GitCommit]) -> str:
 
     try:
         last_commit_date = datetime.fromisoformat(commits[0].date)
-        
-        # Ensure both datetimes are timezone-aware for comparison
-        from datetime import timezone
-        now = datetime.now(timezone.utc)
-        
+
         # If last_commit_date is naive, assume UTC
         if last_commit_date.tzinfo is None:
             last_commit_date = last_commit_date.replace(tzinfo=timezone.utc)
-        
-        days_since = (now - last_commit_date).days
 
-        if days_since < 30:
+        since_last_commit = datetime.now(timezone.utc) - last_commit_date
+
+        if since_last_commit < _HIGH_ACTIVITY_WINDOW:
             return 'high'
-        elif days_since < 90:
+        elif since_last_commit < _MEDIUM_ACTIVITY_WINDOW:
             return 'medium'
         else:
             return 'low'
@@ -160,17 +245,76 @@ def infer_activity_level(commits: List[GitCommit]) -> str:
 
 def extract_tech_stack(languages: List[str], frameworks: List[str]) -> List[str]:
     """Combine languages and frameworks into tech stack."""
-    return sorted(set(languages + frameworks))
-
+    combined = set(languages).union(frameworks)
+    ordered = [name for name in _TECH_STACK_ORDER if name in combined]
+    if len(ordered) == len(combined):
+        return ordered
+    # Names outside the static universe (e.g. GitHub language stats)
+    return sorted(combined)
+
+
+def extract_signals(snapshot: 'RepositorySnapshot') -> TechnicalSignals:
+    """Extract all technical signals from repository snapshot.
+
+    Fuses the language, framework, project-type and maturity passes into
+    a single traversal so per-file path strings are computed once.
+    """
+    suffixes = set()
+    dependency_files = []
+    code_files = []
+    is_cli = is_api = is_web = is_ml = is_automation = is_library = False
+    has_tests = has_ci = has_docs = has_version = False
+
+    for file in snapshot.files:
+        suffix = file.suffix_lower
+        name = file.name_lower
+        path_str = file.path_lower
+
+        suffixes.add(suffix)
+
+        if name in DEPENDENCY_FILE_NAMES:
+            dependency_files.append(file)
+        elif suffix in IMPORT_SCAN_SUFFIXES:
+            code_files.append(file)
+
+        is_cli = is_cli or 'cli' in path_str or 'main.py' in name or 'main.js' in name
+        is_api = is_api or 'api' in path_str or 'app.py' in name or 'server.js' in name
+        is_web = is_web or 'web' in path_str or 'index.html' in name
+        is_ml = is_ml or 'ml' in path_str or 'model' in path_str
+        is_automation = is_automation or 'script' in path_str or 'automation' in path_str
+        is_library = is_library or 'lib' in path_str or 'library' in path_str
+
+        has_tests = has_tests or 'test' in path_str
+        has_ci = has_ci or 'ci' in path_str or '.github' in path_str
+        has_docs = has_docs or 'doc' in path_str or 'readme' in path_str
+        has_version = has_version or 'version' in name
+
+    if is_cli:
+        project_type = ProjectType.CLI
+    elif is_api:
+        project_type = ProjectType.API
+    elif is_web:
+        project_type = ProjectType.WEB_APP
+    elif is_ml:
+        project_type = ProjectType.ML
+    elif is_automation:
+        project_type = ProjectType.AUTOMATION
+    elif is_library:
+        project_type = ProjectType.LIBRARY
+    else:
+        project_type = ProjectType.OTHER
 
-def extract_signals(snapshot) -> TechnicalSignals:
-    """Extract all technical signals from repository snapshot."""
-    from ..ingestion.models import RepositorySnapshot  # to avoid circular
-
-    languages = extract_languages(snapshot.files)
-    frameworks = extract_frameworks(snapshot.files)
-    project_type = infer_project_type(snapshot.files)
-    maturity = infer_maturity(snapshot.files, snapshot.recent_commits)
+    if has_tests and has_ci and has_docs and has_version:
+        maturity = ProjectStatus.PRODUCTION
+    elif has_tests and has_docs:
+        maturity = ProjectStatus.MVP
+    else:
+        maturity = ProjectStatus.PROTOTYPE
+
+    found_languages = {LANGUAGE_EXTENSIONS[s] for s in LANGUAGE_EXTENSIONS.keys() & suffixes}
+    languages = [name for name in _LANGUAGE_ORDER if name in found_languages]
+    found_frameworks = _collect_frameworks(dependency_files, code_files)
+    frameworks = [name for name in _FRAMEWORK_ORDER if name in found_frameworks]
     activity_level = infer_activity_level(snapshot.recent_commits)
     tech_stack = extract_tech_stack(languages, frameworks)
 
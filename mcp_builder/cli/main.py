@@ -2,16 +2,19 @@
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from ..analyzers.signals import extract_signals
-from ..ingestion.walker import ingest_repository
+from ..github.client import parse_github_url
+from ..ingestion.walker import ingest_repository, is_github_url
 from ..intelligence.factory import create_reasoning_engine, list_available_providers
+from ..intelligence.mock import MockReasoningEngine
 from ..intelligence.selector import select_content
 from ..mcp.generator import generate_mcp, load_mcp, save_mcp, validate_mcp
 from ..github.client import GitHubClient
@@ -33,7 +36,8 @@ def init(
     ai_model: Optional[str] = typer.Option(None, "--ai-model", help="Specific AI model to use"),
     openai_key: Optional[str] = typer.Option(None, "--openai-key", help="OpenAI API key"),
     anthropic_key: Optional[str] = typer.Option(None, "--anthropic-key", help="Anthropic API key"),
-    no_interactive: bool = typer.Option(False, "--no-interactive", help="Disable interactive prompts")
+    no_interactive: bool = typer.Option(False, "--no-interactive", help="Disable interactive prompts"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk GitHub API cache")
 ) -> None:
     """Generate initial MCP YAML for a repository (local path or GitHub URL)."""
     try:
@@ -53,7 +57,7 @@ def init(
         github_metrics = None
         if snapshot.github_url and github_token:
             try:
-                github_client = GitHubClient(github_token)
+                github_client = GitHubClient(github_token, use_cache=not no_cache)
                 enricher = GitHubEnricher(github_client)
                 snapshot, github_metrics = enricher.enrich_snapshot(snapshot, snapshot.github_url)
                 
@@ -72,7 +76,7 @@ def init(
         engine_name = engine.__class__.__name__.replace("ReasoningEngine", "").replace("LLM", " LLM")
         console.print(f"[dim]Using {engine_name} reasoning engine[/dim]")
         
-        content = select_content(snapshot)
+        content = select_content(snapshot) if engine.requires_content else ""
         insights = engine.reason(signals, content)
         mcp = generate_mcp(snapshot, signals, insights)
 
@@ -112,7 +116,8 @@ def update(
 @app.command()
 def analyze(
     repo_path: str,
-    github_token: Optional[str] = typer.Option(None, "--github-token", "-t", help="GitHub API token for enhanced metadata")
+    github_token: Optional[str] = typer.Option(None, "--github-token", "-t", help="GitHub API token for enhanced metadata"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk GitHub API cache")
 ) -> None:
     """Analyze repository and show insights without generating files."""
     try:
@@ -127,14 +132,14 @@ def analyze(
         github_metrics = None
         if snapshot.github_url and github_token:
             try:
-                github_client = GitHubClient(github_token)
+                github_client = GitHubClient(github_token, use_cache=not no_cache)
                 enricher = GitHubEnricher(github_client)
                 snapshot, github_metrics = enricher.enrich_snapshot(snapshot, snapshot.github_url)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not fetch GitHub metadata: {e}[/yellow]")
         
         engine = MockReasoningEngine()
-        content = select_content(snapshot)
+        content = select_content(snapshot) if engine.requires_content else ""
         insights = engine.reason(signals, content)
 
         table = Table(title="Repository Analysis")
@@ -175,7 +180,8 @@ def github(
     ai_model: Optional[str] = typer.Option(None, "--ai-model", help="Specific AI model to use"),
     openai_key: Optional[str] = typer.Option(None, "--openai-key", help="OpenAI API key"),
     anthropic_key: Optional[str] = typer.Option(None, "--anthropic-key", help="Anthropic API key"),
-    no_interactive: bool = typer.Option(False, "--no-interactive", help="Disable interactive prompts")
+    no_interactive: bool = typer.Option(False, "--no-interactive", help="Disable interactive prompts"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk GitHub API cache")
 ) -> None:
     """Generate MCP YAML specifically for a GitHub repository with enhanced metadata."""
     try:
@@ -200,7 +206,7 @@ def github(
         github_metrics = None
         if github_token:
             try:
-                github_client = GitHubClient(github_token)
+                github_client = GitHubClient(github_token, use_cache=not no_cache)
                 enricher = GitHubEnricher(github_client)
                 snapshot, github_metrics = enricher.enrich_snapshot(snapshot, github_url)
                 
@@ -229,7 +235,7 @@ def github(
         engine_name = engine.__class__.__name__.replace("ReasoningEngine", "").replace("LLM", " LLM")
         console.print(f"[dim]Using {engine_name} reasoning engine[/dim]")
         
-        content = select_content(snapshot)
+        content = select_content(snapshot) if engine.requires_content else ""
         insights = engine.reason(signals, content)
         mcp = generate_mcp(snapshot, signals, insights)
 
@@ -244,6 +250,53 @@ def github(
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    repo_paths: List[str] = typer.Argument(..., help="Repository paths or GitHub URLs"),
+    github_token: Optional[str] = typer.Option(None, "--github-token", "-t", help="GitHub API token for enhanced metadata"),
+    jobs: int = typer.Option(4, "--jobs", "-j", help="Number of repositories to process in parallel"),
+    ai_provider: str = typer.Option("simple", "--ai-provider", help="AI provider: auto, openai, anthropic, local, simple, mock"),
+    ai_model: Optional[str] = typer.Option(None, "--ai-model", help="Specific AI model to use")
+) -> None:
+    """Generate MCP YAML for multiple repositories in parallel."""
+    if not github_token:
+        github_token = os.getenv("GITHUB_TOKEN")
+
+    # One engine shared across workers; ingestion and GitHub calls are
+    # I/O-bound, so a thread pool overlaps their wait time.
+    engine = create_reasoning_engine(ai_provider, None, ai_model, interactive=False)
+
+    def process(repo_path: str) -> Path:
+        snapshot = ingest_repository(repo_path, github_token)
+        signals = extract_signals(snapshot)
+        content = select_content(snapshot) if engine.requires_content else ""
+        insights = engine.reason(signals, content)
+        mcp = generate_mcp(snapshot, signals, insights)
+
+        if is_github_url(repo_path):
+            owner, repo = parse_github_url(repo_path)
+            output_path = Path.cwd() / f"{owner}-{repo}-mcp.yaml"
+        else:
+            output_path = Path(repo_path) / "mcp.yaml"
+        save_mcp(mcp, output_path)
+        return output_path
+
+    failures = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(process, repo_path): repo_path for repo_path in repo_paths}
+        for future in as_completed(futures):
+            repo_path = futures[future]
+            try:
+                output_path = future.result()
+                console.print(f"[green]✓ {repo_path} -> {output_path}[/green]")
+            except Exception as e:
+                console.print(f"[red]✗ {repo_path}: {e}[/red]")
+                failures += 1
+
+    if failures:
+        raise typer.Exit(1)
+
+
 @app.command()
 def providers() -> None:
     """List available AI providers and their status."""
@@ -324,27 +377,8 @@ def rate_limit(
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
-    """Validate MCP YAML file against schema."""
-    path = Path(mcp_path)
-    if not path.exists():
-        console.print(f"[red]MCP file not found:[/red] {mcp_path}")
-        raise typer.Exit(1)
-
-    try:
-        mcp = load_mcp(path)
-        if validate_mcp(mcp):
-            console.print("[green]✓ MCP file is valid[/green]")
-        else:
-            console.print("[red]✗ MCP file is invalid[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Validation error:[/red] {e}")
-        raise typer.Exit(1)
 
 
-if __name__ == "__main__":
-    app()
-
 @app.command()
 def validate(mcp_path: str) -> None:
     """Validate MCP YAML file against schema."""
@@ -1,27 +1,132 @@
 """GitHub API client."""
 
+import asyncio
+import importlib.util
 import logging
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .models import GitHubContributor, GitHubLanguageStats, GitHubMetrics, GitHubRepository
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 support in httpx needs the optional h2 package
+_HTTP2_AVAILABLE = HTTPX_AVAILABLE and importlib.util.find_spec("h2") is not None
+
+# On-disk cache for GitHub API responses; 304 revalidations via ETag do not
+# count against the API rate limit.
+_HTTP_CACHE_DIR = Path.home() / ".cache" / "mcp-builder"
+
+
+def _decode_json(response):
+    """Decode a JSON response body, using orjson's C parser when available.
+
+    Decode failures are raised as requests.exceptions.JSONDecodeError either
+    way, so callers degrading on requests.RequestException behave the same
+    regardless of which parser handled the body.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(str(e), "", 0) from e
+    return response.json()
+
+
+# Extracts the page number from a Link header rel="last" URL
+_LAST_PAGE_PATTERN = re.compile(r"[?&]page=(\d+)")
+
+# Compiled once; the regexes only run when the fast path below fails
+_GITHUB_URL_PATTERNS = (
+    re.compile(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$"),
+    re.compile(r"github\.com/([^/]+)/([^/]+)"),
+)
+
+
+def parse_github_url(url: str) -> Tuple[str, str]:
+    """Parse GitHub URL to extract owner and repo name."""
+    # Fast path for the dominant https://github.com/OWNER/REPO form
+    if url.startswith("https://github.com/"):
+        parts = url.rstrip("/").removesuffix(".git").split("/")
+        if len(parts) == 5 and parts[3] and parts[4]:
+            return parts[3], parts[4]
+
+    # Handle the remaining GitHub URL formats (ssh, trailing segments, ...)
+    for pattern in _GITHUB_URL_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            owner, repo = match.groups()
+            return owner, repo
+
+    raise ValueError(f"Invalid GitHub URL format: {url}")
+
+
+def _contributors_from_api(data: list) -> list[GitHubContributor]:
+    """Build contributor models from a /contributors API payload."""
+    return [
+        GitHubContributor(
+            login=contributor["login"],
+            contributions=contributor["contributions"],
+            type=contributor["type"]
+        )
+        for contributor in data
+    ]
+
+
+def _language_stats_from_api(languages: dict) -> GitHubLanguageStats:
+    """Build language stats from a /languages API payload."""
+    return GitHubLanguageStats(
+        languages=languages,
+        total_bytes=sum(languages.values())
+    )
+
 
 class GitHubClient:
     """GitHub API client for fetching repository metadata."""
     
-    def __init__(self, token: Optional[str] = None):
-        """Initialize GitHub client with optional authentication token."""
+    def __init__(self, token: Optional[str] = None, use_cache: bool = True):
+        """Initialize GitHub client with optional authentication token.
+
+        Args:
+            token: GitHub API token
+            use_cache: Whether to cache responses on disk (needs requests-cache)
+        """
         self.token = token
         self.base_url = "https://api.github.com"
-        self.session = requests.Session()
-        
+
+        if use_cache and REQUESTS_CACHE_AVAILABLE:
+            self.session = requests_cache.CachedSession(
+                cache_name=str(_HTTP_CACHE_DIR / "github"),
+                backend="sqlite",
+                cache_control=True,
+                expire_after=3600,
+            )
+        else:
+            self.session = requests.Session()
+
         if token:
             self.session.headers.update({"Authorization": f"token {token}"})
         
@@ -33,20 +138,8 @@ class GitHubClient:
     
     def parse_github_url(self, url: str) -> Tuple[str, str]:
         """Parse GitHub URL to extract owner and repo name."""
-        # Handle various GitHub URL formats
-        patterns = [
-            r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$",
-            r"github\.com/([^/]+)/([^/]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                owner, repo = match.groups()
-                return owner, repo
-        
-        raise ValueError(f"Invalid GitHub URL format: {url}")
-    
+        return parse_github_url(url)
+
     def get_repository(self, owner: str, repo: str) -> GitHubRepository:
         """Fetch repository metadata from GitHub API."""
         url = f"{self.base_url}/repos/{owner}/{repo}"
@@ -54,57 +147,58 @@ class GitHubClient:
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            data = response.json()
-            
-            return GitHubRepository(
-                name=data["name"],
-                full_name=data["full_name"],
-                description=data.get("description"),
-                stars=data["stargazers_count"],
-                forks=data["forks_count"],
-                open_issues=data["open_issues_count"],
-                language=data.get("language"),
-                topics=data.get("topics", []),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")),
-                pushed_at=datetime.fromisoformat(data["pushed_at"].replace("Z", "+00:00")),
-                size=data["size"],
-                default_branch=data["default_branch"],
-                license=data["license"]["name"] if data.get("license") else None,
-                has_wiki=data["has_wiki"],
-                has_pages=data["has_pages"],
-                has_projects=data["has_projects"],
-                archived=data["archived"],
-                disabled=data["disabled"],
-            )
-            
+            return GitHubRepository.from_api(_decode_json(response))
+
         except requests.RequestException as e:
             logger.error(f"Failed to fetch repository {owner}/{repo}: {e}")
             raise
     
     def get_contributors(self, owner: str, repo: str, limit: int = 30) -> list[GitHubContributor]:
-        """Fetch repository contributors."""
+        """Fetch repository contributors, paginating up to limit entries."""
         url = f"{self.base_url}/repos/{owner}/{repo}/contributors"
-        params = {"per_page": limit}
-        
+        params = {"per_page": min(limit, 100)}
+        contributors: list[GitHubContributor] = []
+
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            return [
-                GitHubContributor(
-                    login=contributor["login"],
-                    contributions=contributor["contributions"],
-                    type=contributor["type"]
-                )
-                for contributor in data
-            ]
-            
+            # Follow Link: rel="next" pages, cutting off once limit is reached
+            while url and len(contributors) < limit:
+                response = self.session.get(url, params=params)
+                response.raise_for_status()
+                page = _decode_json(response)
+                if not page:
+                    break
+                contributors.extend(_contributors_from_api(page))
+                url = response.links.get("next", {}).get("url")
+                params = None  # the next URL already carries the query string
+            return contributors[:limit]
+
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch contributors for {owner}/{repo}: {e}")
-            return []
-    
+            return contributors
+
+    def count_contributors(self, owner: str, repo: str) -> int:
+        """Count contributors without materializing them.
+
+        Requests a single-entry page and reads the total from the
+        Link: rel="last" page number, so callers that only display a count
+        transfer one JSON object instead of a full page.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/contributors"
+
+        try:
+            response = self.session.get(url, params={"per_page": 1, "anon": "true"})
+            response.raise_for_status()
+            last_url = response.links.get("last", {}).get("url", "")
+            match = _LAST_PAGE_PATTERN.search(last_url)
+            if match:
+                return int(match.group(1))
+            # Single page of results: the body length is the count
+            return len(_decode_json(response))
+
+        except requests.RequestException as e:
+            logger.warning(f"Failed to count contributors for {owner}/{repo}: {e}")
+            return 0
+
     def get_language_stats(self, owner: str, repo: str) -> GitHubLanguageStats:
         """Fetch programming language statistics."""
         url = f"{self.base_url}/repos/{owner}/{repo}/languages"
@@ -112,15 +206,8 @@ class GitHubClient:
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            languages = response.json()
-            
-            total_bytes = sum(languages.values())
-            
-            return GitHubLanguageStats(
-                languages=languages,
-                total_bytes=total_bytes
-            )
-            
+            return _language_stats_from_api(_decode_json(response))
+
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch language stats for {owner}/{repo}: {e}")
             return GitHubLanguageStats(languages={}, total_bytes=0)
@@ -131,9 +218,17 @@ class GitHubClient:
         
         logger.info(f"Fetching GitHub metrics for {owner}/{repo}")
         
-        repository = self.get_repository(owner, repo)
-        contributors = self.get_contributors(owner, repo)
-        language_stats = self.get_language_stats(owner, repo)
+        # The three endpoints are independent, so issue them concurrently;
+        # total latency drops from the sum of the round trips to the max.
+        # requests.Session is thread-safe for GET and keeps keep-alive reuse.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            repository_future = executor.submit(self.get_repository, owner, repo)
+            contributors_future = executor.submit(self.get_contributors, owner, repo)
+            language_stats_future = executor.submit(self.get_language_stats, owner, repo)
+
+            repository = repository_future.result()
+            contributors = contributors_future.result()
+            language_stats = language_stats_future.result()
         
         return GitHubMetrics(
             repository=repository,
@@ -146,11 +241,104 @@ class GitHubClient:
     def check_rate_limit(self) -> dict:
         """Check current GitHub API rate limit status."""
         url = f"{self.base_url}/rate_limit"
-        
+
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return _decode_json(response)
         except requests.RequestException as e:
             logger.warning(f"Failed to check rate limit: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+
+class AsyncGitHubClient:
+    """Async GitHub API client that multiplexes requests over one connection.
+
+    Uses httpx with HTTP/2 (when the h2 package is installed) and a shared
+    connection pool, so fetching several endpoints or repositories pays the
+    TLS handshake once instead of per request.
+    """
+
+    def __init__(self, token: Optional[str] = None):
+        """Initialize async GitHub client with optional authentication token."""
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx package not installed. Run: pip install httpx")
+
+        self.token = token
+        headers = {
+            "User-Agent": "MCP-Builder/1.0",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if token:
+            headers["Authorization"] = f"token {token}"
+
+        self.client = httpx.AsyncClient(
+            base_url="https://api.github.com",
+            headers=headers,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    async def get_repository(self, owner: str, repo: str) -> GitHubRepository:
+        """Fetch repository metadata from GitHub API."""
+        response = await self.client.get(f"/repos/{owner}/{repo}")
+        response.raise_for_status()
+        return GitHubRepository.from_api(_decode_json(response))
+
+    async def get_contributors(self, owner: str, repo: str, limit: int = 30) -> list[GitHubContributor]:
+        """Fetch repository contributors."""
+        try:
+            response = await self.client.get(
+                f"/repos/{owner}/{repo}/contributors",
+                params={"per_page": limit}
+            )
+            response.raise_for_status()
+            return _contributors_from_api(_decode_json(response))
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to fetch contributors for {owner}/{repo}: {e}")
+            return []
+
+    async def get_language_stats(self, owner: str, repo: str) -> GitHubLanguageStats:
+        """Fetch programming language statistics."""
+        try:
+            response = await self.client.get(f"/repos/{owner}/{repo}/languages")
+            response.raise_for_status()
+            return _language_stats_from_api(_decode_json(response))
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to fetch language stats for {owner}/{repo}: {e}")
+            return GitHubLanguageStats(languages={}, total_bytes=0)
+
+    async def get_repository_metrics(self, github_url: str) -> GitHubMetrics:
+        """Fetch comprehensive repository metrics concurrently."""
+        owner, repo = parse_github_url(github_url)
+
+        logger.info(f"Fetching GitHub metrics for {owner}/{repo}")
+
+        repository, contributors, language_stats = await asyncio.gather(
+            self.get_repository(owner, repo),
+            self.get_contributors(owner, repo),
+            self.get_language_stats(owner, repo),
+        )
+
+        return GitHubMetrics(
+            repository=repository,
+            contributors=contributors,
+            language_stats=language_stats,
+            clone_url=f"https://github.com/{owner}/{repo}.git",
+            ssh_url=f"git@github.com:{owner}/{repo}.git"
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    def get_repository_metrics_sync(self, github_url: str) -> GitHubMetrics:
+        """Sync facade over get_repository_metrics for CLI callers."""
+        async def fetch() -> GitHubMetrics:
+            try:
+                return await self.get_repository_metrics(github_url)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(fetch())
\ No newline at end of file
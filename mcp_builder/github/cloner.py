@@ -2,11 +2,12 @@
 
 import logging
 import shutil
+import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-
-import git
+from typing import Dict, List, Optional
 
 from .client import GitHubClient
 
@@ -42,29 +43,57 @@ class GitHubCloner:
         
         logger.info(f"Cloning {clone_url} to {target_dir}")
         
+        # Invoke git directly: --filter=blob:none defers blob downloads and
+        # --no-tags skips tag refs, so only the files of the default branch
+        # tip are actually transferred.
+        command = ["git", "clone", "--single-branch", "--no-tags"]
+        if shallow:
+            command.extend(["--depth=1", "--filter=blob:none"])
+        command.extend([clone_url, str(target_dir)])
+
         try:
-            # Clone options for efficiency
-            clone_kwargs = {
-                "depth": 1 if shallow else None,
-                "single_branch": True,
-                "branch": None,  # Use default branch
-            }
-            
-            # Remove None values
-            clone_kwargs = {k: v for k, v in clone_kwargs.items() if v is not None}
-            
-            repo_obj = git.Repo.clone_from(clone_url, target_dir, **clone_kwargs)
-            
+            subprocess.run(command, check=True, capture_output=True)
+
             logger.info(f"Successfully cloned {owner}/{repo} to {target_dir}")
             return target_dir
-            
-        except git.GitCommandError as e:
-            logger.error(f"Failed to clone repository {clone_url}: {e}")
+
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace").strip() if e.stderr else e
+            logger.error(f"Failed to clone repository {clone_url}: {stderr}")
             # Clean up failed clone directory
             if target_dir.exists():
                 shutil.rmtree(target_dir, ignore_errors=True)
             raise
     
+    def clone_many(self, urls: List[str]) -> Dict[str, Optional[Path]]:
+        """Clone several repositories concurrently.
+
+        Cloning is network-bound, so a thread pool overlaps the transfers
+        instead of paying each round trip sequentially.
+
+        Args:
+            urls: GitHub repository URLs to clone
+
+        Returns:
+            Mapping of URL to clone path, or None where the clone failed
+        """
+        started = time.monotonic()
+
+        def clone_one(url: str) -> Optional[Path]:
+            try:
+                return self.clone_to_temp(url)
+            except Exception as e:
+                logger.error(f"Failed to clone {url}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = dict(zip(urls, executor.map(clone_one, urls)))
+
+        elapsed = time.monotonic() - started
+        succeeded = sum(1 for path in results.values() if path is not None)
+        logger.info(f"Cloned {succeeded}/{len(urls)} repositories in {elapsed:.1f}s")
+        return results
+
     def clone_to_temp(self, github_url: str) -> Path:
         """Clone repository to a temporary directory.
         
@@ -1,14 +1,28 @@
 """GitHub data enrichment for repository snapshots."""
 
+import heapq
 import logging
+from operator import itemgetter
+from pathlib import Path
 from typing import Optional
 
-from .client import GitHubClient
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+from .client import GitHubClient, parse_github_url
 from .models import GitHubMetrics
 from ..ingestion.models import RepositorySnapshot
 
 logger = logging.getLogger(__name__)
 
+# Assembled GitHubMetrics cached on disk; re-running against the same
+# repository within the TTL skips all three API round trips.
+_METRICS_CACHE_DIR = Path.home() / ".cache" / "mcp-builder" / "metrics"
+_METRICS_TTL_SECONDS = 3600
+
 
 class GitHubEnricher:
     """Enriches repository snapshots with GitHub metadata."""
@@ -16,7 +30,27 @@ class GitHubEnricher:
     def __init__(self, github_client: GitHubClient):
         """Initialize with GitHub client."""
         self.github_client = github_client
-    
+        self._metrics_cache = (
+            diskcache.Cache(str(_METRICS_CACHE_DIR)) if DISKCACHE_AVAILABLE else None
+        )
+
+    def _get_repository_metrics(self, github_url: str) -> GitHubMetrics:
+        """Fetch metrics, consulting the on-disk cache first."""
+        owner, repo = parse_github_url(github_url)
+        cache_key = f"{owner}/{repo}"
+
+        if self._metrics_cache is not None:
+            cached = self._metrics_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached GitHub metrics for {cache_key}")
+                return cached
+
+        metrics = self.github_client.get_repository_metrics(github_url)
+
+        if self._metrics_cache is not None:
+            self._metrics_cache.set(cache_key, metrics, expire=_METRICS_TTL_SECONDS)
+        return metrics
+
     def enrich_snapshot(self, snapshot: RepositorySnapshot, github_url: str) -> tuple[RepositorySnapshot, GitHubMetrics]:
         """Enrich repository snapshot with GitHub metadata.
         
@@ -28,7 +62,7 @@ class GitHubEnricher:
             Tuple of (original snapshot, GitHub metrics)
         """
         try:
-            github_metrics = self.github_client.get_repository_metrics(github_url)
+            github_metrics = self._get_repository_metrics(github_url)
             logger.info(f"Enriched snapshot with GitHub data: {github_metrics.repository.stars} stars, "
                        f"{len(github_metrics.contributors)} contributors")
             return snapshot, github_metrics
@@ -45,28 +79,30 @@ class GitHubEnricher:
                 github_metrics.activity_level in ["active", "very_active"])
     
     def merge_language_data(self, local_languages: list[str], github_metrics: GitHubMetrics) -> list[str]:
-        """Merge local language detection with GitHub language stats."""
-        github_languages = []
-        
-        if github_metrics.language_stats.languages:
-            # Sort by bytes and take top languages
-            sorted_langs = sorted(
-                github_metrics.language_stats.languages.items(),
-                key=lambda x: x[1],
-                reverse=True
+        """Merge local language detection with GitHub language stats.
+
+        GitHub languages that make up 5%+ of the codebase come first,
+        followed by locally detected ones. Heap selection of the top 10
+        and a seen-set dedupe keep this a single pass; the result is
+        capped at 10 anyway, so the full dict never needs sorting.
+        """
+        merged = []
+        seen = set()
+
+        total_bytes = github_metrics.language_stats.total_bytes
+        if github_metrics.language_stats.languages and total_bytes > 0:
+            significant = total_bytes * 0.05  # 5%+ of codebase
+            top = heapq.nlargest(
+                10, github_metrics.language_stats.languages.items(), key=itemgetter(1)
             )
-            
-            # Convert to percentage and filter significant languages (>5%)
-            total_bytes = github_metrics.language_stats.total_bytes
-            for lang, bytes_count in sorted_langs:
-                percentage = (bytes_count / total_bytes) * 100 if total_bytes > 0 else 0
-                if percentage >= 5.0:  # Only include languages that are 5%+ of codebase
-                    github_languages.append(lang)
-        
-        # Combine and deduplicate, prioritizing GitHub data if available
-        if github_languages:
-            combined = github_languages + [lang for lang in local_languages if lang not in github_languages]
-        else:
-            combined = local_languages
-        
-        return combined[:10]  # Limit to top 10 languages
\ No newline at end of file
+            for lang, bytes_count in top:
+                if bytes_count >= significant and lang not in seen:
+                    seen.add(lang)
+                    merged.append(lang)
+
+        for lang in local_languages:
+            if lang not in seen:
+                seen.add(lang)
+                merged.append(lang)
+
+        return merged[:10]  # Limit to top 10 languages
\ No newline at end of file
@@ -1,11 +1,11 @@
 """GitHub-specific data models."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubRepository:
     """GitHub repository metadata."""
     name: str
@@ -28,8 +28,49 @@ class GitHubRepository:
     archived: bool
     disabled: bool
 
+    def __post_init__(self):
+        # Normalize timestamps to aware UTC once, so consumers compare
+        # them directly instead of re-checking tzinfo on every access.
+        if self.created_at.tzinfo is None:
+            self.created_at = self.created_at.replace(tzinfo=timezone.utc)
+        if self.updated_at.tzinfo is None:
+            self.updated_at = self.updated_at.replace(tzinfo=timezone.utc)
+        if self.pushed_at.tzinfo is None:
+            self.pushed_at = self.pushed_at.replace(tzinfo=timezone.utc)
 
-@dataclass
+    @classmethod
+    def from_api(cls, data: dict) -> "GitHubRepository":
+        """Build a repository model directly from a /repos API payload."""
+        license_info = data.get("license")
+        return cls(
+            name=data["name"],
+            full_name=data["full_name"],
+            description=data.get("description"),
+            stars=data["stargazers_count"],
+            forks=data["forks_count"],
+            open_issues=data["open_issues_count"],
+            language=data.get("language"),
+            topics=data.get("topics", []),
+            created_at=_parse_timestamp(data["created_at"]),
+            updated_at=_parse_timestamp(data["updated_at"]),
+            pushed_at=_parse_timestamp(data["pushed_at"]),
+            size=data["size"],
+            default_branch=data["default_branch"],
+            license=license_info["name"] if license_info else None,
+            has_wiki=data["has_wiki"],
+            has_pages=data["has_pages"],
+            has_projects=data["has_projects"],
+            archived=data["archived"],
+            disabled=data["disabled"],
+        )
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO-8601 timestamp (trailing Z) into a datetime."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@dataclass(slots=True)
 class GitHubContributor:
     """GitHub contributor information."""
     login: str
@@ -37,14 +78,14 @@ class GitHubContributor:
     type: str  # User or Bot
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubLanguageStats:
     """Programming language statistics from GitHub."""
     languages: dict[str, int]  # language -> bytes
     total_bytes: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubMetrics:
     """Aggregated GitHub metrics for analysis."""
     repository: GitHubRepository
@@ -52,55 +93,36 @@ class GitHubMetrics:
     language_stats: GitHubLanguageStats
     clone_url: str
     ssh_url: str
-    
-    @property
-    def popularity_score(self) -> float:
-        """Calculate popularity score based on stars, forks, and contributors."""
-        return (self.repository.stars * 1.0 + 
-                self.repository.forks * 0.5 + 
-                len(self.contributors) * 0.3)
-    
-    @property
-    def activity_level(self) -> str:
-        """Determine activity level based on recent updates."""
-        from datetime import timezone
-        
-        # Ensure both datetimes are timezone-aware
+    # Derived once at construction against a single "now" reading; the
+    # repository timestamps are already aware UTC (see GitHubRepository).
+    activity_level: str = field(init=False, repr=False)
+    maturity_indicators: dict[str, bool] = field(init=False, repr=False)
+
+    def __post_init__(self):
         now = datetime.now(timezone.utc)
-        pushed_at = self.repository.pushed_at
-        
-        # If pushed_at is naive, assume UTC
-        if pushed_at.tzinfo is None:
-            pushed_at = pushed_at.replace(tzinfo=timezone.utc)
-        
-        days_since_update = (now - pushed_at).days
+
+        days_since_update = (now - self.repository.pushed_at).days
         if days_since_update <= 7:
-            return "very_active"
+            self.activity_level = "very_active"
         elif days_since_update <= 30:
-            return "active"
+            self.activity_level = "active"
         elif days_since_update <= 90:
-            return "moderate"
+            self.activity_level = "moderate"
         else:
-            return "inactive"
-    
-    @property
-    def maturity_indicators(self) -> dict[str, bool]:
-        """Indicators of project maturity."""
-        from datetime import timezone
-        
-        # Ensure timezone-aware comparison
-        now = datetime.now(timezone.utc)
-        created_at = self.repository.created_at
-        
-        # If created_at is naive, assume UTC
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-        
-        return {
+            self.activity_level = "inactive"
+
+        self.maturity_indicators = {
             "has_license": self.repository.license is not None,
             "has_wiki": self.repository.has_wiki,
             "has_pages": self.repository.has_pages,
             "multiple_contributors": len(self.contributors) > 1,
-            "established": (now - created_at).days > 90,
+            "established": (now - self.repository.created_at).days > 90,
             "popular": self.repository.stars > 10,
-        }
\ No newline at end of file
+        }
+
+    @property
+    def popularity_score(self) -> float:
+        """Calculate popularity score based on stars, forks, and contributors."""
+        return (self.repository.stars * 1.0 +
+                self.repository.forks * 0.5 +
+                len(self.contributors) * 0.3)
\ No newline at end of file
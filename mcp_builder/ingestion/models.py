@@ -1,19 +1,62 @@
 """Data models for ingestion layer."""
 
-from dataclasses import dataclass
+import mmap
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
+# Files above this size are memory-mapped and only this prefix is kept;
+# downstream consumers (framework scans, LLM prompts) read prefixes, so
+# holding multi-hundred-KB tails in memory buys nothing.
+_LARGE_FILE_THRESHOLD = 64 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class FileContent:
-    """Represents content of a file with metadata."""
+    """Represents content of a file with metadata.
+
+    Content is loaded lazily: most files never have their text consumed
+    (only the top-priority subset reaches the reasoning engines), so the
+    snapshot holds paths and metadata instead of the whole repository.
+    """
     path: Path
-    content: str
     priority: int  # Higher values for more important files
+    size: int  # Size in bytes from the directory scan
+    _content: Optional[str] = field(default=None, repr=False)
+    # Lowered path parts, computed once so analyzers don't re-parse the
+    # Path object on every traversal.
+    suffix_lower: str = field(init=False, repr=False)
+    name_lower: str = field(init=False, repr=False)
+    path_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.suffix_lower = self.path.suffix.lower()
+        self.name_lower = self.path.name.lower()
+        self.path_lower = str(self.path).lower()
+
+    @property
+    def content(self) -> str:
+        """File text, read and decoded on first access, then cached.
+
+        Large files are mapped with mmap and truncated to the threshold
+        prefix, sidestepping a full copy of the file into the heap.
+        """
+        if self._content is None:
+            try:
+                if self.size > _LARGE_FILE_THRESHOLD:
+                    with open(self.path, 'rb') as f:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            self._content = bytes(mm[:_LARGE_FILE_THRESHOLD]).decode(
+                                'utf-8', errors='ignore'
+                            )
+                else:
+                    self._content = self.path.read_text(encoding='utf-8', errors='ignore')
+            except (OSError, ValueError):
+                self._content = ''
+        return self._content
 
 
-@dataclass
+@dataclass(slots=True)
 class GitCommit:
     """Represents a git commit."""
     hash: str
@@ -22,7 +65,7 @@ class GitCommit:
     date: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositorySnapshot:
     """Snapshot of repository content."""
     root_path: Path
@@ -30,4 +73,6 @@ class RepositorySnapshot:
     recent_commits: List[GitCommit]
     is_git_repo: bool
     github_url: Optional[str] = None  # GitHub URL if this is a GitHub repository
-    is_github_clone: bool = False  # True if this was cloned from GitHub
\ No newline at end of file
+    is_github_clone: bool = False  # True if this was cloned from GitHub
+    # README indexed once at ingestion so consumers don't rescan files
+    readme: Optional[FileContent] = None
\ No newline at end of file
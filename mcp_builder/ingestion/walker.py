@@ -1,15 +1,16 @@
 """Repository walker and content collector."""
 
+import heapq
 import logging
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
 from typing import List, Optional
 
-import git
-
 from .models import FileContent, GitCommit, RepositorySnapshot
-from ..github.client import GitHubClient
-from ..github.cloner import GitHubCloner
-from ..github.enricher import GitHubEnricher
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +28,30 @@ IGNORE_DIRS = {
     '.mypy_cache',
     '.tox',
     '.eggs',
-    '*.egg-info',
 }
 
+# Directory name suffixes to ignore (glob-style names don't fit the
+# exact-match set above)
+IGNORE_DIR_SUFFIXES = ('.egg-info',)
+
+
+def _is_ignored_dir(name: str) -> bool:
+    """Check if a directory name should be pruned from traversal."""
+    return name in IGNORE_DIRS or name.endswith(IGNORE_DIR_SUFFIXES)
+
+
+# Any ignored directory as a whole path component, compiled once so
+# should_ignore_path scans the path string in a single pass instead of
+# splitting it into parts and probing the set per component.
+_IGNORE_PATTERN = re.compile(
+    r"(?:^|/)(?:"
+    + "|".join(
+        sorted(map(re.escape, IGNORE_DIRS))
+        + [rf"[^/]+{re.escape(suffix)}" for suffix in IGNORE_DIR_SUFFIXES]
+    )
+    + r")(?:/|$)"
+)
+
 # High priority files
 HIGH_PRIORITY_FILES = {
     'readme.md',
@@ -56,59 +78,141 @@ CONFIG_FILES = {
 }
 
 
-def calculate_priority(path: Path) -> int:
-    """Calculate priority score for a file (higher is more important)."""
-    name = path.name.lower()
-    if name in HIGH_PRIORITY_FILES:
+# Suffix sets for calculate_priority, hoisted out of the per-file call
+CODE_SUFFIXES = frozenset({'.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.go', '.rs'})
+DOC_SUFFIXES = frozenset({'.md', '.txt', '.rst'})
+
+
+def calculate_priority(name_lower: str, suffix_lower: str) -> int:
+    """Calculate priority score for a file (higher is more important).
+
+    Takes the precomputed lowercase name and suffix so callers in the
+    collection loop lowercase each path component exactly once.
+    """
+    if name_lower in HIGH_PRIORITY_FILES:
         return 10
-    if name in CONFIG_FILES:
+    if name_lower in CONFIG_FILES:
         return 8
-    if path.suffix.lower() in {'.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.go', '.rs'}:
+    if suffix_lower in CODE_SUFFIXES:
         return 5
-    if path.suffix.lower() in {'.md', '.txt', '.rst'}:
+    if suffix_lower in DOC_SUFFIXES:
         return 7
     return 1
 
 
 def should_ignore_path(path: Path) -> bool:
     """Check if path should be ignored."""
-    return any(part in IGNORE_DIRS for part in path.parts)
-
-
-def collect_files(root: Path) -> List[FileContent]:
-    """Collect readable text files from the repository."""
-    files = []
-    for path in root.rglob('*'):
-        if path.is_file() and not should_ignore_path(path):
-            try:
-                content = path.read_text(encoding='utf-8', errors='ignore')
-                priority = calculate_priority(path)
-                files.append(FileContent(path, content, priority))
-            except (OSError, UnicodeDecodeError):
-                logger.debug(f"Skipping unreadable file: {path}")
-                continue
+    return bool(_IGNORE_PATTERN.search(path.as_posix()))
+
+
+# Files above this size are skipped outright (lockfiles, vendored bundles)
+MAX_FILE_BYTES = 512 * 1024
+
+# Leading bytes checked for null bytes to reject binary files before a
+# full read
+_BINARY_SNIFF_BYTES = 4096
+
+
+def _iter_files(root: Path):
+    """Yield (path, size) pairs under root using os.scandir.
+
+    Ignored directories are pruned during descent, so their contents are
+    never stat'ed, and file type/size come from the cached DirEntry
+    metadata instead of a per-path stat call.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_ignored_dir(entry.name):
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path), entry.stat(follow_symlinks=False).st_size
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory: {e}")
+
+
+def _read_one(path: Path, size: int) -> Optional[FileContent]:
+    """Sniff a single file into a FileContent, or None if skipped.
+
+    Only the first 4 KB are read here, to reject binaries; full text is
+    loaded lazily when FileContent.content is first accessed. Files that
+    fit entirely in the sniffed chunk are cached up front since their
+    bytes are already in hand.
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(_BINARY_SNIFF_BYTES)
+        if b'\x00' in head:
+            logger.debug(f"Skipping binary file: {path}")
+            return None
+        name_lower = path.name.lower()
+        priority = calculate_priority(name_lower, os.path.splitext(name_lower)[1])
+        if size <= _BINARY_SNIFF_BYTES:
+            return FileContent(path, priority, size, head.decode('utf-8', errors='ignore'))
+        return FileContent(path, priority, size)
+    except (OSError, UnicodeDecodeError):
+        logger.debug(f"Skipping unreadable file: {path}")
+        return None
+
+
+def collect_files(root: Path, top_k: Optional[int] = None) -> List[FileContent]:
+    """Collect readable text files from the repository.
+
+    Reads are I/O-bound and the GIL releases around the read syscalls, so
+    they run on a thread pool; traversal and the size guard stay on the
+    calling thread since DirEntry metadata is already in hand.
+
+    Args:
+        root: Repository root directory
+        top_k: If set, return only the top_k highest-priority files
+            (heap selection, O(n log k) instead of a full sort)
+    """
+    paths = []
+    sizes = []
+    for path, size in _iter_files(root):
+        if size > MAX_FILE_BYTES:
+            logger.debug(f"Skipping large file ({size} bytes): {path}")
+            continue
+        paths.append(path)
+        sizes.append(size)
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        files = [f for f in executor.map(_read_one, paths, sizes) if f is not None]
+
+    if top_k is not None:
+        # nlargest already returns the selection sorted by priority
+        return heapq.nlargest(top_k, files, key=lambda f: f.priority)
     # Sort by priority descending
     files.sort(key=lambda f: f.priority, reverse=True)
     return files
 
 
 def get_recent_commits(root: Path, limit: int = 10) -> List[GitCommit]:
-    """Get recent git commits if repository is a git repo."""
+    """Get recent git commits if repository is a git repo.
+
+    Shells out to git log directly; one subprocess and a line split beat
+    building GitPython's per-commit object graph.
+    """
     try:
-        repo = git.Repo(root)
-        commits = list(repo.iter_commits('HEAD', max_count=limit))
-        return [
-            GitCommit(
-                hash=c.hexsha,
-                message=c.message.strip(),
-                author=c.author.name,
-                date=str(c.authored_datetime),
-            )
-            for c in commits
-        ]
-    except git.InvalidGitRepositoryError:
+        out = subprocess.check_output(
+            ["git", "-C", str(root), "log", "-n", str(limit),
+             "--pretty=format:%H%x09%an%x09%aI%x09%s"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        )
+    except (subprocess.CalledProcessError, OSError):
+        # Not a git repository (or git is unavailable)
         return []
 
+    commits = []
+    for line in out.splitlines():
+        commit_hash, author, date, subject = line.split('\t', 3)
+        commits.append(GitCommit(hash=commit_hash, message=subject, author=author, date=date))
+    return commits
+
 
 def ingest_repository(repo_path: str, github_token: Optional[str] = None) -> RepositorySnapshot:
     """Ingest repository content into a snapshot.
@@ -125,12 +229,30 @@ def ingest_repository(repo_path: str, github_token: Optional[str] = None) -> Rep
 
 
 def is_github_url(path: str) -> bool:
-    """Check if the path is a GitHub URL."""
-    return "github.com" in path.lower()
+    """Check if the path is a GitHub URL.
+
+    Matches on the parsed hostname rather than a substring scan, so local
+    paths stay O(1) and lookalike hosts (github.com.evil) are rejected.
+    """
+    # SSH form has no scheme for urlparse to anchor on
+    if path.startswith("git@github.com:"):
+        return True
+    # Local paths lack a scheme separator; skip the parse entirely
+    if "://" not in path:
+        return False
+    try:
+        return urlparse(path).hostname in ("github.com", "www.github.com")
+    except ValueError:
+        return False
 
 
 def ingest_github_repository(github_url: str, github_token: Optional[str] = None) -> RepositorySnapshot:
     """Ingest a GitHub repository by cloning it temporarily."""
+    # Imported here so local-only ingestion never pays for the GitHub
+    # client stack (requests and friends) at module load.
+    from ..github.client import GitHubClient
+    from ..github.cloner import GitHubCloner
+
     github_client = GitHubClient(github_token)
     cloner = GitHubCloner(github_client)
     
@@ -140,7 +262,12 @@ def ingest_github_repository(github_url: str, github_token: Optional[str] = None
         
         # Ingest the cloned repository
         snapshot = ingest_local_repository(str(clone_path))
-        
+
+        # The temporary clone is deleted below, so pull file contents into
+        # memory while the files still exist.
+        for file in snapshot.files:
+            file.content
+
         # Mark as GitHub clone and add URL
         snapshot.github_url = github_url
         snapshot.is_github_clone = True
@@ -157,8 +284,13 @@ def ingest_github_repository(github_url: str, github_token: Optional[str] = None
             cloner.cleanup_temp_clone(clone_path)
 
 
-def ingest_local_repository(repo_path: str) -> RepositorySnapshot:
-    """Ingest local repository content into a snapshot."""
+def ingest_local_repository(repo_path: str, max_files: Optional[int] = None) -> RepositorySnapshot:
+    """Ingest local repository content into a snapshot.
+
+    Args:
+        repo_path: Local repository path
+        max_files: Optional cap on collected files (highest priority kept)
+    """
     root = Path(repo_path).resolve()
     if not root.exists():
         raise ValueError(f"Repository path does not exist: {repo_path}")
@@ -166,15 +298,20 @@ def ingest_local_repository(repo_path: str) -> RepositorySnapshot:
         raise ValueError(f"Repository path is not a directory: {repo_path}")
 
     logger.info(f"Ingesting repository at {root}")
-    files = collect_files(root)
+    files = collect_files(root, top_k=max_files)
     commits = get_recent_commits(root)
     is_git_repo = len(commits) > 0
 
+    # Index the README once so consumers get it in O(1) instead of
+    # rescanning (and re-lowercasing) the file list per lookup
+    readme = next((f for f in files if f.name_lower.startswith('readme')), None)
+
     return RepositorySnapshot(
         root_path=root,
         files=files,
         recent_commits=commits,
         is_git_repo=is_git_repo,
         github_url=None,
-        is_github_clone=False
+        is_github_clone=False,
+        readme=readme
     )
\ No newline at end of file
@@ -1 +1,50 @@
-"""Intelligence layer for AI-powered reasoning."""
\ No newline at end of file
+"""Intelligence layer for AI-powered reasoning."""
+
+import importlib
+import sys
+
+__all__ = [
+    "AnthropicReasoningEngine",
+    "AsyncAnthropicReasoningEngine",
+    "AsyncOpenAIReasoningEngine",
+    "Insights",
+    "LocalLLMReasoningEngine",
+    "MockReasoningEngine",
+    "OpenAIReasoningEngine",
+    "ReasoningEngine",
+    "SimpleLLMReasoningEngine",
+    "create_reasoning_engine",
+    "list_available_providers",
+]
+
+# PEP 562 lazy namespace: each name resolves its module on first access
+# only, so importing the package never drags in transformers/torch or
+# the provider SDKs.
+_LAZY = {
+    "AnthropicReasoningEngine": (".anthropic_engine", "AnthropicReasoningEngine"),
+    "AsyncAnthropicReasoningEngine": (".anthropic_engine", "AsyncAnthropicReasoningEngine"),
+    "AsyncOpenAIReasoningEngine": (".openai_engine", "AsyncOpenAIReasoningEngine"),
+    "Insights": (".models", "Insights"),
+    "LocalLLMReasoningEngine": (".local_llm", "LocalLLMReasoningEngine"),
+    "MockReasoningEngine": (".mock", "MockReasoningEngine"),
+    "OpenAIReasoningEngine": (".openai_engine", "OpenAIReasoningEngine"),
+    "ReasoningEngine": (".base", "ReasoningEngine"),
+    "SimpleLLMReasoningEngine": (".local_llm", "SimpleLLMReasoningEngine"),
+    "create_reasoning_engine": (".factory", "create_reasoning_engine"),
+    "list_available_providers": (".factory", "list_available_providers"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_path, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module_path, __name__), attr)
+    # Cache on the module so subsequent lookups skip __getattr__ entirely
+    setattr(sys.modules[__name__], name, obj)
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
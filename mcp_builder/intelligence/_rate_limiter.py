@@ -0,0 +1,66 @@
+"""Client-side rate limiting for provider API calls."""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token-bucket limiter pacing requests-per-minute and tokens-per-minute.
+
+    Bursting a batch fan-out past the provider's RPM/TPM limits trips 429
+    responses whose retry-after pauses cost far more than pacing up front.
+    Both budgets refill continuously against the monotonic clock; acquire()
+    sleeps just long enough for the larger deficit to refill.
+    """
+
+    def __init__(self, rpm: int = 500, tpm: int = 200_000):
+        """Initialize the limiter.
+
+        Args:
+            rpm: Sustained requests per minute
+            tpm: Sustained tokens per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+        self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Block until one request plus estimated_tokens fit in the budget.
+
+        The lock serializes waiters, so paced requests leave in FIFO order.
+        """
+        # A request estimated above the whole per-minute budget could never
+        # be satisfied and would spin forever; clamp it to a full bucket so
+        # it waits for the bucket to fill and then proceeds alone.
+        estimated_tokens = min(estimated_tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1.0 and self._tokens >= estimated_tokens:
+                    self._requests -= 1.0
+                    self._tokens -= estimated_tokens
+                    return
+                request_wait = max(0.0, 1.0 - self._requests) * 60.0 / self.rpm
+                token_wait = max(0.0, estimated_tokens - self._tokens) * 60.0 / self.tpm
+                await asyncio.sleep(max(request_wait, token_wait, 0.01))
+
+    def sync_remaining(self, requests_remaining=None, tokens_remaining=None) -> None:
+        """Clamp local budgets to server-reported x-ratelimit-remaining values.
+
+        Call with the header values when available so the local estimate
+        never runs ahead of what the provider will actually accept.
+        """
+        if requests_remaining is not None:
+            self._requests = min(self._requests, float(requests_remaining))
+        if tokens_remaining is not None:
+            self._tokens = min(self._tokens, float(tokens_remaining))
@@ -1,14 +1,24 @@
 """Anthropic Claude-powered reasoning engine."""
 
+import asyncio
+import hashlib
 import json
 import logging
+import re
+from pathlib import Path
 from typing import Optional
 
 try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
+    import diskcache
+    DISKCACHE_AVAILABLE = True
 except ImportError:
-    ANTHROPIC_AVAILABLE = False
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .base import ReasoningEngine
 from .models import Insights
@@ -16,6 +26,88 @@ from ..analyzers.models import TechnicalSignals
 
 logger = logging.getLogger(__name__)
 
+# The anthropic SDK import is heavyweight (httpx, pydantic machinery),
+# so it is deferred until an engine is actually constructed rather than
+# paid on every CLI invocation.
+_anthropic = None
+
+
+def _require_anthropic():
+    """Import the anthropic SDK on first use and memoize the module."""
+    global _anthropic
+    if _anthropic is None:
+        try:
+            import anthropic
+        except ImportError:
+            raise ImportError("Anthropic package not installed. Run: pip install anthropic")
+        _anthropic = anthropic
+    return _anthropic
+
+
+# Prompt content budget, estimated at ~4 characters per token
+_CHARS_PER_TOKEN = 4
+_CONTENT_TOKEN_BUDGET = 6000
+
+# Parsed responses cached on disk keyed by prompt digest; identical
+# prompts (same repo, same signals) skip the API round trip entirely.
+_RESPONSE_CACHE_DIR = Path.home() / ".cache" / "mcp-builder" / "anthropic"
+_RESPONSE_TTL_SECONDS = 7 * 86400
+
+# Fenced JSON block in a model response; one scan replaces paired find()s
+_JSON_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Prompt skeleton bound once at import; _build_prompt only fills the slots
+_PROMPT_TEMPLATE = """
+You are an expert software analyst. Analyze this software repository and provide structured insights.
+
+TECHNICAL SIGNALS:
+- Languages: {languages}
+- Frameworks: {frameworks}
+- Project Type: {project_type}
+- Maturity: {maturity}
+- Activity Level: {activity_level}
+
+REPOSITORY CONTENT (high-priority files, compacted):
+{content}
+
+Please analyze this repository and respond with a JSON object containing:
+{{
+    "problem": "What specific problem does this project solve? (1-2 sentences)",
+    "solution": "How does this project solve the problem? (1-2 sentences)",
+    "value_proposition": "What value does this provide to users? (1-2 sentences)",
+    "target_users": "Who are the primary users of this project? (1 sentence)",
+    "key_features": ["List 3-5 key features as short phrases"],
+    "current_focus": "What is the current development focus? (1 sentence)",
+    "future_plans": "What are likely future plans for this project? (1 sentence)"
+}}
+
+Base your analysis on the actual code, documentation, and project structure. Be specific and accurate.
+Respond only with the JSON object, no additional text.
+"""
+
+# One Anthropic client per API key, shared across engine instances so the
+# underlying HTTP connection pool (and its TLS handshakes) is reused.
+_CLIENTS: dict = {}
+
+
+def _get_client(api_key: Optional[str]):
+    """Return the shared Anthropic client for this API key."""
+    if api_key not in _CLIENTS:
+        anthropic = _require_anthropic()
+        _CLIENTS[api_key] = anthropic.Anthropic(api_key=api_key, max_retries=2, timeout=30)
+    return _CLIENTS[api_key]
+
+
+def _compact_content(content: str) -> str:
+    """Strip blank lines and cut content at the prompt token budget.
+
+    Content arrives ordered by file priority (see select_content), so a
+    budget cut keeps the highest-signal text; dropping blank lines spends
+    the remaining tokens on code and prose instead of whitespace.
+    """
+    compact = '\n'.join(line for line in content.splitlines() if line.strip())
+    return compact[:_CONTENT_TOKEN_BUDGET * _CHARS_PER_TOKEN]
+
 
 class AnthropicReasoningEngine(ReasoningEngine):
     """Anthropic Claude-powered reasoning engine for generating project insights."""
@@ -27,17 +119,26 @@ class AnthropicReasoningEngine(ReasoningEngine):
             api_key: Anthropic API key (if None, uses environment variable)
             model: Claude model to use
         """
-        if not ANTHROPIC_AVAILABLE:
-            raise ImportError("Anthropic package not installed. Run: pip install anthropic")
-        
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Raises ImportError here if the SDK is missing
+        self.client = _get_client(api_key)
         self.model = model
-    
+        self._cache = (
+            diskcache.Cache(str(_RESPONSE_CACHE_DIR)) if DISKCACHE_AVAILABLE else None
+        )
+
     def reason(self, signals: TechnicalSignals, content: str) -> Insights:
         """Generate insights using Anthropic Claude."""
         try:
             prompt = self._build_prompt(signals, content)
-            
+
+            cache_key = None
+            if self._cache is not None:
+                cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached Anthropic response")
+                    return cached
+
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=2000,
@@ -49,62 +150,39 @@ class AnthropicReasoningEngine(ReasoningEngine):
                     }
                 ]
             )
-            
+
             result = response.content[0].text
-            return self._parse_response(result)
-            
+            insights = self._parse_response(result)
+            if cache_key is not None:
+                self._cache.set(cache_key, insights, expire=_RESPONSE_TTL_SECONDS)
+            return insights
+
         except Exception as e:
             logger.error(f"Anthropic reasoning failed: {e}")
             # Fallback to mock insights
             return self._fallback_insights()
     
     def _build_prompt(self, signals: TechnicalSignals, content: str) -> str:
-        """Build the analysis prompt."""
-        return f"""
-You are an expert software analyst. Analyze this software repository and provide structured insights.
-
-TECHNICAL SIGNALS:
-- Languages: {', '.join(signals.languages)}
-- Frameworks: {', '.join(signals.frameworks)}
-- Project Type: {signals.project_type.value}
-- Maturity: {signals.maturity.value}
-- Activity Level: {signals.activity_level}
-
-REPOSITORY CONTENT (first 8000 chars):
-{content[:8000]}
+        """Build the analysis prompt from the prebuilt template."""
+        return _PROMPT_TEMPLATE.format_map({
+            "languages": signals.languages_csv,
+            "frameworks": signals.frameworks_csv,
+            "project_type": signals.project_type.value,
+            "maturity": signals.maturity.value,
+            "activity_level": signals.activity_level,
+            "content": _compact_content(content),
+        })
 
-Please analyze this repository and respond with a JSON object containing:
-{{
-    "problem": "What specific problem does this project solve? (1-2 sentences)",
-    "solution": "How does this project solve the problem? (1-2 sentences)", 
-    "value_proposition": "What value does this provide to users? (1-2 sentences)",
-    "target_users": "Who are the primary users of this project? (1 sentence)",
-    "key_features": ["List 3-5 key features as short phrases"],
-    "current_focus": "What is the current development focus? (1 sentence)",
-    "future_plans": "What are likely future plans for this project? (1 sentence)"
-}}
 
-Base your analysis on the actual code, documentation, and project structure. Be specific and accurate.
-Respond only with the JSON object, no additional text.
-"""
-    
     def _parse_response(self, response: str) -> Insights:
         """Parse Anthropic response into Insights object."""
         try:
             # Extract JSON from response (handle markdown code blocks)
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-            else:
-                json_str = response.strip()
-            
-            data = json.loads(json_str)
-            
+            match = _JSON_BLOCK_PATTERN.search(response)
+            json_str = match.group(1) if match else response.strip()
+
+            data = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
+
             return Insights(
                 problem=data.get("problem", "Project addresses domain-specific challenges."),
                 solution=data.get("solution", "Implements comprehensive solution using modern practices."),
@@ -115,7 +193,7 @@ Respond only with the JSON object, no additional text.
                 future_plans=data.get("future_plans", "Expanding features and community adoption.")
             )
             
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:
             logger.warning(f"Failed to parse Anthropic response: {e}")
             return self._fallback_insights()
     
@@ -134,4 +212,78 @@ Respond only with the JSON object, no additional text.
             ],
             current_focus="Enhancing core features and improving documentation.",
             future_plans="Expanding capabilities and growing the user community."
-        )
\ No newline at end of file
+        )
+
+
+class AsyncAnthropicReasoningEngine(AnthropicReasoningEngine):
+    """Async Anthropic engine that fans reasoning calls out concurrently.
+
+    Reasoning over N repositories is latency-bound on the API round trip;
+    scheduling the calls with asyncio.gather under a semaphore brings wall
+    clock close to the slowest single call instead of the sum.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-haiku-20240307",
+                 max_concurrency: int = 10):
+        """Initialize async Anthropic reasoning engine.
+
+        Args:
+            api_key: Anthropic API key (if None, uses environment variable)
+            model: Claude model to use
+            max_concurrency: Maximum in-flight API calls (guards against 429s)
+        """
+        super().__init__(api_key=api_key, model=model)
+        self.max_concurrency = max_concurrency
+        self._aclient = _require_anthropic().AsyncAnthropic(api_key=api_key, max_retries=2, timeout=30)
+
+    async def reason_async(self, signals: TechnicalSignals, content: str) -> Insights:
+        """Generate insights using Anthropic Claude without blocking."""
+        try:
+            prompt = self._build_prompt(signals, content)
+
+            cache_key = None
+            if self._cache is not None:
+                cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached Anthropic response")
+                    return cached
+
+            response = await self._aclient.messages.create(
+                model=self.model,
+                max_tokens=2000,
+                temperature=0.3,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            )
+
+            result = response.content[0].text
+            insights = self._parse_response(result)
+            if cache_key is not None:
+                self._cache.set(cache_key, insights, expire=_RESPONSE_TTL_SECONDS)
+            return insights
+
+        except Exception as e:
+            logger.error(f"Anthropic reasoning failed: {e}")
+            return self._fallback_insights()
+
+    async def reason_many(self, jobs: list) -> list:
+        """Reason over (signals, content) pairs concurrently.
+
+        Args:
+            jobs: Sequence of (TechnicalSignals, content) tuples
+
+        Returns:
+            Insights in the same order as the input jobs
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(signals: TechnicalSignals, content: str) -> Insights:
+            async with semaphore:
+                return await self.reason_async(signals, content)
+
+        return list(await asyncio.gather(*(bounded(s, c) for s, c in jobs)))
\ No newline at end of file
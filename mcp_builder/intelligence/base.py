@@ -9,6 +9,10 @@ from ..analyzers.models import TechnicalSignals
 class ReasoningEngine(ABC):
     """Abstract base class for AI reasoning engines."""
 
+    #: Whether reason() actually reads the selected repository content.
+    #: Engines that ignore it let callers skip content selection entirely.
+    requires_content: bool = True
+
     @abstractmethod
     def reason(self, signals: TechnicalSignals, content: str) -> Insights:
         """Generate project insights from signals and content.
@@ -2,17 +2,34 @@
 
 import os
 import logging
+import threading
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Optional
 
-import typer
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-
 from .base import ReasoningEngine
 from .mock import MockReasoningEngine
 
 logger = logging.getLogger(__name__)
-console = Console()
+
+# rich is only needed on interactive paths; importing it lazily keeps
+# non-interactive engine creation off the CLI cold-start critical path.
+_console_instance = None
+
+
+def _console():
+    """Memoized rich Console, imported on first interactive use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
+
+
+# Engine instances are reused across CLI commands (e.g. update -> init), so
+# provider probing and HTTP client construction only happen once per process.
+_ENGINE_CACHE: dict = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
 
 
 def create_reasoning_engine(
@@ -22,17 +39,49 @@ def create_reasoning_engine(
     interactive: bool = True
 ) -> ReasoningEngine:
     """Create a reasoning engine based on provider and availability.
-    
+
     Args:
         provider: AI provider ("openai", "anthropic", "local", "simple", "mock", or "auto")
         api_key: API key for the provider
         model: Specific model to use
         interactive: Whether to prompt user for missing configuration
-        
+
     Returns:
         Configured reasoning engine
     """
-    
+    # Interactive flows may prompt and mutate the environment mid-setup,
+    # so they always build fresh.
+    if interactive:
+        return _create_engine(provider, api_key, model, interactive)
+
+    # Resolve auto to a concrete provider before keying, so "auto" and an
+    # explicit request for the same provider share one instance.
+    if provider == "auto":
+        provider = _detect_available_provider(False)
+
+    cache_key = (provider, api_key, model)
+    with _ENGINE_CACHE_LOCK:
+        engine = _ENGINE_CACHE.get(cache_key)
+        if engine is None:
+            engine = _create_engine(provider, api_key, model, interactive)
+            _ENGINE_CACHE[cache_key] = engine
+    return engine
+
+
+def clear_engine_cache() -> None:
+    """Drop cached engine instances (e.g. after configuration changes)."""
+    with _ENGINE_CACHE_LOCK:
+        _ENGINE_CACHE.clear()
+
+
+def _create_engine(
+    provider: str,
+    api_key: Optional[str],
+    model: Optional[str],
+    interactive: bool
+) -> ReasoningEngine:
+    """Build a reasoning engine instance for create_reasoning_engine."""
+
     if provider == "mock":
         return MockReasoningEngine()
     
@@ -45,11 +94,18 @@ def create_reasoning_engine(
     # Auto-detect available providers
     if provider == "auto":
         provider = _detect_available_provider(interactive)
-    
+
+    # Snapshot the API-key environment once for the rest of the call
+    # chain (after detection, which may have set a key interactively).
+    env = {
+        "openai": os.environ.get("OPENAI_API_KEY"),
+        "anthropic": os.environ.get("ANTHROPIC_API_KEY"),
+    }
+
     if provider == "openai":
-        return _create_openai_engine(api_key, model, interactive)
+        return _create_openai_engine(api_key, model, interactive, env)
     elif provider == "anthropic":
-        return _create_anthropic_engine(api_key, model, interactive)
+        return _create_anthropic_engine(api_key, model, interactive, env)
     elif provider == "simple":
         return _create_simple_engine()
     elif provider == "local":
@@ -59,39 +115,60 @@ def create_reasoning_engine(
         return _create_simple_engine()
 
 
+def _providers_cache_key() -> tuple:
+    """Environment inputs that affect provider availability."""
+    return (os.environ.get("OPENAI_API_KEY", ""), os.environ.get("ANTHROPIC_API_KEY", ""))
+
+
 def _detect_available_provider(interactive: bool = True) -> str:
-    """Detect which AI provider is available based on API keys."""
-    
+    """Detect which AI provider is available based on API keys.
+
+    Non-interactive detection is memoized per API-key environment; the
+    interactive path may prompt and mutate the environment, so it always
+    runs fresh.
+    """
+    if interactive:
+        env = {
+            "openai": os.environ.get("OPENAI_API_KEY"),
+            "anthropic": os.environ.get("ANTHROPIC_API_KEY"),
+        }
+        return _detect_provider_impl(True, env)
+    return _cached_detect_provider(_providers_cache_key())
+
+
+@lru_cache(maxsize=4)
+def _cached_detect_provider(key: tuple) -> str:
+    return _detect_provider_impl(False, {"openai": key[0] or None, "anthropic": key[1] or None})
+
+
+def _detect_provider_impl(interactive: bool, env: dict) -> str:
+    """Probe API keys and installed packages for a usable provider."""
+
+    # Availability is answered by find_spec without executing the
+    # packages; the real imports stay in the engine constructors.
+
     # Check for OpenAI
-    openai_key = os.getenv("OPENAI_API_KEY")
-    if openai_key:
-        try:
-            from .openai_engine import OpenAIReasoningEngine
+    if env["openai"]:
+        if find_spec("openai") is not None:
             logger.info("Using OpenAI reasoning engine")
             return "openai"
-        except ImportError:
-            logger.warning("OpenAI API key found but package not installed")
-    
+        logger.warning("OpenAI API key found but package not installed")
+
     # Check for Anthropic
-    anthropic_key = os.getenv("ANTHROPIC_API_KEY")
-    if anthropic_key:
-        try:
-            from .anthropic_engine import AnthropicReasoningEngine
+    if env["anthropic"]:
+        if find_spec("anthropic") is not None:
             logger.info("Using Anthropic reasoning engine")
             return "anthropic"
-        except ImportError:
-            logger.warning("Anthropic API key found but package not installed")
-    
+        logger.warning("Anthropic API key found but package not installed")
+
     # Check for local LLM capability
-    try:
-        import transformers
-        if interactive:
-            console.print("[yellow]No cloud AI provider found.[/yellow]")
-            use_local = Confirm.ask("Would you like to use a local LLM? (requires downloading models)")
-            if use_local:
-                return "local"
-    except ImportError:
-        pass
+    if interactive and find_spec("transformers") is not None:
+        from rich.prompt import Confirm
+
+        _console().print("[yellow]No cloud AI provider found.[/yellow]")
+        use_local = Confirm.ask("Would you like to use a local LLM? (requires downloading models)")
+        if use_local:
+            return "local"
     
     # Offer interactive setup if no provider is available
     if interactive:
@@ -103,6 +180,9 @@ def _detect_available_provider(interactive: bool = True) -> str:
 
 def _interactive_provider_setup() -> str:
     """Interactive setup for AI providers."""
+    from rich.prompt import Prompt
+
+    console = _console()
     console.print("\n[bold blue]AI Provider Setup[/bold blue]")
     console.print("No AI provider is currently configured. Choose an option:")
     console.print("1. [green]OpenAI[/green] (recommended, requires API key)")
@@ -127,6 +207,9 @@ def _interactive_provider_setup() -> str:
 
 def _setup_openai_interactive() -> str:
     """Interactive OpenAI setup."""
+    from rich.prompt import Prompt, Confirm
+
+    console = _console()
     console.print("\n[bold green]OpenAI Setup[/bold green]")
     console.print("You need an OpenAI API key. Get one at: https://platform.openai.com/api-keys")
     
@@ -145,6 +228,9 @@ def _setup_openai_interactive() -> str:
 
 def _setup_anthropic_interactive() -> str:
     """Interactive Anthropic setup."""
+    from rich.prompt import Prompt, Confirm
+
+    console = _console()
     console.print("\n[bold blue]Anthropic Setup[/bold blue]")
     console.print("You need an Anthropic API key. Get one at: https://console.anthropic.com/")
     
@@ -161,17 +247,35 @@ def _setup_anthropic_interactive() -> str:
     return "simple"
 
 
-def _create_openai_engine(api_key: Optional[str], model: Optional[str], interactive: bool) -> ReasoningEngine:
+def _report_missing_package(provider: str, package_spec: str, interactive: bool) -> None:
+    """Tell the user how to install a missing provider package.
+
+    Installation happens out-of-band: forking pip here is slow, can leave
+    a long-running process with a half-imported package, and blocks engine
+    creation for seconds. Printing the command and falling back is cheap
+    and keeps this path synchronous.
+    """
+    if interactive:
+        console = _console()
+        console.print(f"[red]{provider} package not installed[/red]")
+        console.print(f"[dim]Install it with: pip install {package_spec}, then rerun[/dim]")
+    logger.error(f"{provider} package not installed. Run: pip install {package_spec}")
+
+
+def _create_openai_engine(api_key: Optional[str], model: Optional[str], interactive: bool,
+                          env: Optional[dict] = None) -> ReasoningEngine:
     """Create OpenAI reasoning engine."""
     try:
         from .openai_engine import OpenAIReasoningEngine
-        
-        # Use provided key or environment variable
+
+        # Use provided key or the environment snapshot
         if not api_key:
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = env["openai"] if env else os.environ.get("OPENAI_API_KEY")
         
         if not api_key and interactive:
-            console.print("[yellow]No OpenAI API key found[/yellow]")
+            from rich.prompt import Prompt, Confirm
+
+            _console().print("[yellow]No OpenAI API key found[/yellow]")
             if Confirm.ask("Would you like to enter your OpenAI API key now?"):
                 api_key = Prompt.ask("Enter your OpenAI API key", password=True)
                 if api_key:
@@ -188,32 +292,24 @@ def _create_openai_engine(api_key: Optional[str], model: Optional[str], interact
         return OpenAIReasoningEngine(api_key=api_key, model=model)
         
     except ImportError:
-        if interactive:
-            console.print("[red]OpenAI package not installed[/red]")
-            if Confirm.ask("Would you like to install it? (pip install openai)"):
-                import subprocess
-                try:
-                    subprocess.check_call(["pip", "install", "openai"])
-                    console.print("[green]✓ OpenAI package installed[/green]")
-                    return _create_openai_engine(api_key, model, False)
-                except subprocess.CalledProcessError:
-                    console.print("[red]Failed to install OpenAI package[/red]")
-        
-        logger.error("OpenAI package not installed. Run: pip install openai")
+        _report_missing_package("OpenAI", "openai", interactive)
         return _create_simple_engine()
 
 
-def _create_anthropic_engine(api_key: Optional[str], model: Optional[str], interactive: bool) -> ReasoningEngine:
+def _create_anthropic_engine(api_key: Optional[str], model: Optional[str], interactive: bool,
+                             env: Optional[dict] = None) -> ReasoningEngine:
     """Create Anthropic reasoning engine."""
     try:
         from .anthropic_engine import AnthropicReasoningEngine
-        
-        # Use provided key or environment variable
+
+        # Use provided key or the environment snapshot
         if not api_key:
-            api_key = os.getenv("ANTHROPIC_API_KEY")
+            api_key = env["anthropic"] if env else os.environ.get("ANTHROPIC_API_KEY")
         
         if not api_key and interactive:
-            console.print("[yellow]No Anthropic API key found[/yellow]")
+            from rich.prompt import Prompt, Confirm
+
+            _console().print("[yellow]No Anthropic API key found[/yellow]")
             if Confirm.ask("Would you like to enter your Anthropic API key now?"):
                 api_key = Prompt.ask("Enter your Anthropic API key", password=True)
                 if api_key:
@@ -230,18 +326,7 @@ def _create_anthropic_engine(api_key: Optional[str], model: Optional[str], inter
         return AnthropicReasoningEngine(api_key=api_key, model=model)
         
     except ImportError:
-        if interactive:
-            console.print("[red]Anthropic package not installed[/red]")
-            if Confirm.ask("Would you like to install it? (pip install anthropic)"):
-                import subprocess
-                try:
-                    subprocess.check_call(["pip", "install", "anthropic"])
-                    console.print("[green]✓ Anthropic package installed[/green]")
-                    return _create_anthropic_engine(api_key, model, False)
-                except subprocess.CalledProcessError:
-                    console.print("[red]Failed to install Anthropic package[/red]")
-        
-        logger.error("Anthropic package not installed. Run: pip install anthropic")
+        _report_missing_package("Anthropic", "anthropic", interactive)
         return _create_simple_engine()
 
 
@@ -252,12 +337,15 @@ def _create_local_llm_engine(model: Optional[str], interactive: bool) -> Reasoni
         
         if not model:
             if interactive:
+                from rich.prompt import Prompt
+
+                console = _console()
                 console.print("\n[bold yellow]Local LLM Setup[/bold yellow]")
                 console.print("Available models:")
                 console.print("1. microsoft/DialoGPT-medium (default, ~350MB)")
                 console.print("2. gpt2 (lightweight, ~500MB)")
                 console.print("3. distilgpt2 (smallest, ~250MB)")
-                
+
                 choice = Prompt.ask("Select model", choices=["1", "2", "3"], default="1")
                 model_map = {
                     "1": "microsoft/DialoGPT-medium",
@@ -268,22 +356,11 @@ def _create_local_llm_engine(model: Optional[str], interactive: bool) -> Reasoni
             else:
                 model = "microsoft/DialoGPT-medium"
         
-        console.print(f"[dim]Loading local model: {model}[/dim]")
+        _console().print(f"[dim]Loading local model: {model}[/dim]")
         return LocalLLMReasoningEngine(model_name=model)
-        
+
     except ImportError:
-        if interactive:
-            console.print("[red]Transformers package not installed[/red]")
-            if Confirm.ask("Would you like to install it? (pip install transformers torch)"):
-                import subprocess
-                try:
-                    subprocess.check_call(["pip", "install", "transformers", "torch"])
-                    console.print("[green]✓ Transformers package installed[/green]")
-                    return _create_local_llm_engine(model, False)
-                except subprocess.CalledProcessError:
-                    console.print("[red]Failed to install transformers package[/red]")
-        
-        logger.error("Transformers package not installed. Run: pip install transformers torch")
+        _report_missing_package("Transformers", "transformers torch", interactive)
         return _create_simple_engine()
 
 
@@ -294,54 +371,39 @@ def _create_simple_engine() -> ReasoningEngine:
 
 
 def list_available_providers() -> dict[str, bool]:
-    """List available AI providers and their status."""
+    """List available AI providers and their status.
+
+    The probe result is memoized per API-key environment; call
+    list_available_providers.cache_clear() to invalidate (e.g. in tests).
+    """
+    return _list_available_providers_cached(_providers_cache_key())
+
+
+@lru_cache(maxsize=4)
+def _list_available_providers_cached(key: tuple) -> dict[str, bool]:
+    openai_key, anthropic_key = key
     providers = {}
-    
-    # Check OpenAI
-    try:
-        import openai
-        providers["openai"] = {
-            "available": True,
-            "has_key": bool(os.getenv("OPENAI_API_KEY")),
-            "package": "openai"
-        }
-    except ImportError:
-        providers["openai"] = {
-            "available": False,
-            "has_key": bool(os.getenv("OPENAI_API_KEY")),
-            "package": "openai"
-        }
-    
-    # Check Anthropic
-    try:
-        import anthropic
-        providers["anthropic"] = {
-            "available": True,
-            "has_key": bool(os.getenv("ANTHROPIC_API_KEY")),
-            "package": "anthropic"
-        }
-    except ImportError:
-        providers["anthropic"] = {
-            "available": False,
-            "has_key": bool(os.getenv("ANTHROPIC_API_KEY")),
-            "package": "anthropic"
-        }
-    
-    # Check Local LLM
-    try:
-        import transformers
-        providers["local"] = {
-            "available": True,
-            "has_key": True,
-            "package": "transformers"
-        }
-    except ImportError:
-        providers["local"] = {
-            "available": False,
-            "has_key": True,
-            "package": "transformers"
-        }
-    
+
+    # find_spec answers "is it installed?" without executing the package
+    providers["openai"] = {
+        "available": find_spec("openai") is not None,
+        "has_key": bool(openai_key),
+        "package": "openai"
+    }
+
+    providers["anthropic"] = {
+        "available": find_spec("anthropic") is not None,
+        "has_key": bool(anthropic_key),
+        "package": "anthropic"
+    }
+
+    providers["local"] = {
+        "available": find_spec("transformers") is not None,
+        "has_key": True,
+        "package": "transformers"
+    }
+
+
     # Simple and Mock are always available
     providers["simple"] = {
         "available": True,
@@ -354,5 +416,9 @@ def list_available_providers() -> dict[str, bool]:
         "has_key": True,
         "package": "built-in"
     }
-    
-    return providers
\ No newline at end of file
+
+    return providers
+
+
+# Invalidation hook for tests and config changes
+list_available_providers.cache_clear = _list_available_providers_cached.cache_clear
\ No newline at end of file
@@ -1,15 +1,17 @@
 """Local LLM reasoning engine using Python-based models."""
 
+import hashlib
 import json
 import logging
+import re
+from pathlib import Path
 from typing import Optional
 
 try:
-    import transformers
-    from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
-    TRANSFORMERS_AVAILABLE = True
+    import diskcache
+    DISKCACHE_AVAILABLE = True
 except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+    DISKCACHE_AVAILABLE = False
 
 from .base import ReasoningEngine
 from .models import Insights
@@ -17,6 +19,53 @@ from ..analyzers.models import TechnicalSignals
 
 logger = logging.getLogger(__name__)
 
+# Local generation costs seconds of CPU/GPU per call, so parsed results
+# are cached on disk keyed by model and prompt digest.
+_REASONING_CACHE_DIR = Path.home() / ".cache" / "mcp-builder" / "local-llm"
+_REASONING_TTL_SECONDS = 30 * 86400
+
+# Static prompt fragments bound once at import; _build_prompt only joins
+# them with the per-call values, skipping f-string format parsing.
+_PROMPT_HEAD = "Analyze this software project:\n\nLanguages: "
+_PROMPT_MID1 = "\nType: "
+_PROMPT_MID2 = "\nContent: "
+_PROMPT_TAIL = "\n\nWhat problem does this solve?"
+
+# Indicator keywords for extracting problem/solution lines from
+# unstructured model output, hoisted so _parse_response builds no tuples
+_PROBLEM_WORDS = ("problem", "challenge", "issue")
+_SOLUTION_WORDS = ("solution", "solves", "addresses")
+
+# Keyword signals cluster near the top of READMEs; capping the scanned
+# content bounds per-call work even for pathologically large inputs.
+_CONTENT_SCAN_CAP = 8192
+
+
+def _require_transformers():
+    """Return the transformers package wrapped in a LazyLoader.
+
+    find_spec answers "is it installed?" immediately (so missing installs
+    still fail fast), but the package's ~1s of import-time machinery only
+    runs on first attribute access, not here.
+    """
+    import importlib.util
+    import sys
+
+    module = sys.modules.get("transformers")
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec("transformers")
+    if spec is None:
+        raise ImportError("Transformers package not installed. Run: pip install transformers torch")
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["transformers"] = module
+    loader.exec_module(module)
+    return module
+
 
 class LocalLLMReasoningEngine(ReasoningEngine):
     """Local LLM reasoning engine using Hugging Face transformers."""
@@ -27,91 +76,170 @@ class LocalLLMReasoningEngine(ReasoningEngine):
         Args:
             model_name: Hugging Face model name to use
         """
-        if not TRANSFORMERS_AVAILABLE:
-            raise ImportError("Transformers package not installed. Run: pip install transformers torch")
-        
+        # Raises ImportError here, before any model download is attempted
+        transformers = _require_transformers()
+
         self.model_name = model_name
-        self.pipeline = None
-        self._initialize_model()
-    
-    def _initialize_model(self):
-        """Initialize the local model pipeline."""
+        self.tokenizer = None
+        self.model = None
+        self._cache = (
+            diskcache.Cache(str(_REASONING_CACHE_DIR)) if DISKCACHE_AVAILABLE else None
+        )
+        self._initialize_model(transformers)
+
+    def _initialize_model(self, transformers):
+        """Load the tokenizer and model directly, skipping the pipeline wrapper."""
         try:
             logger.info(f"Loading local model: {self.model_name}")
-            
-            # Use a lightweight model for text generation
-            self.pipeline = pipeline(
-                "text-generation",
-                model=self.model_name,
-                tokenizer=self.model_name,
-                max_length=1000,
-                do_sample=True,
-                temperature=0.7,
-                pad_token_id=50256  # GPT-2 pad token
-            )
-            
+
+            # On GPU, fp16 halves memory bandwidth and enables tensor cores
+            model_kwargs = {}
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    model_kwargs["torch_dtype"] = torch.float16
+                    model_kwargs["device_map"] = "auto"
+            except ImportError:
+                pass
+
+            # First attribute access here triggers the real transformers import
+            tokenizer = transformers.AutoTokenizer.from_pretrained(self.model_name)
+            # Derive the pad token from the tokenizer instead of hardcoding
+            # the GPT-2 id, so non-GPT-2 tokenizers pad correctly; left
+            # padding keeps generated tokens contiguous for causal models
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            tokenizer.padding_side = "left"
+
+            self.tokenizer = tokenizer
+            self.model = transformers.AutoModelForCausalLM.from_pretrained(
+                self.model_name, **model_kwargs
+            ).eval()
+
             logger.info("Local model loaded successfully")
-            
+
         except Exception as e:
             logger.error(f"Failed to load local model: {e}")
-            self.pipeline = None
-    
+            self.tokenizer = None
+            self.model = None
+
+    def _generate(self, prompts: list) -> list:
+        """Run one batched generate() call and return the completions.
+
+        Tokenizing and calling model.generate() directly avoids the
+        per-call overhead of the pipeline wrapper, and inference_mode
+        skips autograd bookkeeping entirely.
+        """
+        import torch
+
+        inputs = self.tokenizer(
+            prompts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=1024,
+        ).to(self.model.device)
+
+        with torch.inference_mode():
+            output = self.model.generate(
+                **inputs,
+                max_new_tokens=500,
+                do_sample=True,
+                temperature=0.3,
+                pad_token_id=self.tokenizer.eos_token_id,
+            )
+
+        # With left padding every prompt ends at the same column, so the
+        # completion is everything after the shared prompt width
+        prompt_width = inputs["input_ids"].shape[1]
+        return [
+            self.tokenizer.decode(sequence[prompt_width:], skip_special_tokens=True).strip()
+            for sequence in output
+        ]
+
     def reason(self, signals: TechnicalSignals, content: str) -> Insights:
         """Generate insights using local LLM."""
-        if not self.pipeline:
+        if self.model is None:
             logger.warning("Local model not available, using fallback")
             return self._fallback_insights()
-        
+
         try:
             prompt = self._build_prompt(signals, content)
-            
-            # Generate response using local model
-            response = self.pipeline(
-                prompt,
-                max_length=len(prompt) + 500,
-                num_return_sequences=1,
-                temperature=0.3,
-                do_sample=True
-            )
-            
-            generated_text = response[0]['generated_text']
-            # Extract only the generated part (after the prompt)
-            result = generated_text[len(prompt):].strip()
-            
-            return self._parse_response(result)
-            
+
+            cache_key = None
+            if self._cache is not None:
+                digest_input = f"{self.model_name}|{prompt}".encode()
+                cache_key = hashlib.blake2b(digest_input, digest_size=16).hexdigest()
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached local LLM response")
+                    return cached
+
+            result = self._generate([prompt])[0]
+
+            insights = self._parse_response(result)
+            if cache_key is not None:
+                self._cache.set(cache_key, insights, expire=_REASONING_TTL_SECONDS)
+            return insights
+
         except Exception as e:
             logger.error(f"Local LLM reasoning failed: {e}")
             return self._fallback_insights()
-    
-    def _build_prompt(self, signals: TechnicalSignals, content: str) -> str:
-        """Build a simple prompt for local models."""
-        return f"""Analyze this software project:
 
-Languages: {', '.join(signals.languages)}
-Type: {signals.project_type.value}
-Content: {content[:2000]}
+    def reason_batch(self, items: list) -> list:
+        """Reason over (signals, content) pairs in one batched forward pass.
+
+        Batching amortizes the Python-to-tensor dispatch overhead and lets
+        the model use its available parallelism instead of running batch-1
+        per repository.
+        """
+        if self.model is None:
+            logger.warning("Local model not available, using fallback")
+            return [self._fallback_insights() for _ in items]
+
+        prompts = [self._build_prompt(signals, content) for signals, content in items]
+        try:
+            return [self._parse_response(result) for result in self._generate(prompts)]
+
+        except Exception as e:
+            logger.error(f"Local LLM batch reasoning failed: {e}")
+            return [self._fallback_insights() for _ in items]
 
-What problem does this solve?"""
+    def _build_prompt(self, signals: TechnicalSignals, content: str) -> str:
+        """Build a simple prompt for local models."""
+        return "".join((
+            _PROMPT_HEAD,
+            signals.languages_csv,
+            _PROMPT_MID1,
+            signals.project_type.value,
+            _PROMPT_MID2,
+            content[:2000],
+            _PROMPT_TAIL,
+        ))
     
     def _parse_response(self, response: str) -> Insights:
         """Parse local model response into structured insights."""
         # Local models may not produce structured JSON, so we extract key information
-        lines = response.split('\n')
-        
-        # Try to extract meaningful information from the response
         problem = "Addresses specific technical challenges in software development."
         solution = "Provides a comprehensive solution using modern development practices."
-        
-        # Look for problem/solution indicators in the response
-        for line in lines:
+
+        # Look for problem/solution indicators, stopping at the first match
+        # for each so long outputs are not scanned past what's needed
+        found_problem = found_solution = False
+        for line in response.splitlines():
             line = line.strip()
-            if line and len(line) > 20:
-                if any(word in line.lower() for word in ['problem', 'challenge', 'issue']):
-                    problem = line[:200]
-                elif any(word in line.lower() for word in ['solution', 'solves', 'addresses']):
-                    solution = line[:200]
-        
+            if len(line) <= 20:
+                continue
+            low = line.lower()
+            if not found_problem and any(word in low for word in _PROBLEM_WORDS):
+                problem = line[:200]
+                found_problem = True
+            elif not found_solution and any(word in low for word in _SOLUTION_WORDS):
+                solution = line[:200]
+                found_solution = True
+            if found_problem and found_solution:
+                break
+
         return Insights(
             problem=problem,
             solution=solution,
@@ -129,28 +257,102 @@ What problem does this solve?"""
     
     def _fallback_insights(self) -> Insights:
         """Fallback insights when local LLM fails."""
-        return Insights(
-            problem="This project addresses specific technical challenges in its domain.",
-            solution="The project provides a comprehensive solution using modern development practices.",
-            value_proposition="Offers improved efficiency, reliability, and user experience.",
-            target_users="Developers, engineers, and technical professionals.",
-            key_features=[
-                "Modern architecture and design",
-                "Comprehensive functionality", 
-                "Developer-friendly interface",
-                "Reliable performance"
-            ],
-            current_focus="Enhancing core features and improving documentation.",
-            future_plans="Expanding capabilities and growing the user community."
-        )
+        return _FALLBACK_INSIGHTS
+
+
+# Shared fallback built once at import; returned whenever the local model
+# is unavailable or fails. Treated as immutable by all consumers.
+_FALLBACK_INSIGHTS = Insights(
+    problem="This project addresses specific technical challenges in its domain.",
+    solution="The project provides a comprehensive solution using modern development practices.",
+    value_proposition="Offers improved efficiency, reliability, and user experience.",
+    target_users="Developers, engineers, and technical professionals.",
+    key_features=[
+        "Modern architecture and design",
+        "Comprehensive functionality",
+        "Developer-friendly interface",
+        "Reliable performance"
+    ],
+    current_focus="Enhancing core features and improving documentation.",
+    future_plans="Expanding capabilities and growing the user community."
+)
+
+# Per-project-type insight text, hoisted so _analyze_project_type is a
+# dict lookup instead of a branch chain rebuilding literals every call.
+_PROJECT_INSIGHTS = {
+    "web_app": {
+        "problem": "Building modern web applications requires managing complex frontend and backend interactions, state management, and user experience optimization.",
+        "solution": "This web application provides a streamlined architecture with modern frameworks and best practices for scalable development.",
+        "value_proposition": "Delivers fast, responsive user experiences with maintainable code architecture.",
+        "target_users": "Web developers, frontend engineers, and product teams building user-facing applications.",
+        "future_plans": "Expanding cross-platform support and adding advanced user interface components."
+    },
+    "cli": {
+        "problem": "Developers need efficient command-line tools that are easy to use, well-documented, and integrate seamlessly into existing workflows.",
+        "solution": "This CLI tool provides intuitive commands with comprehensive help documentation and robust error handling.",
+        "value_proposition": "Streamlines development workflows and automates repetitive tasks with reliable command-line interface.",
+        "target_users": "Software developers, DevOps engineers, and system administrators.",
+        "future_plans": "Adding more automation features and improving cross-platform compatibility."
+    },
+    "api": {
+        "problem": "Creating robust APIs requires careful design of endpoints, data validation, authentication, and comprehensive documentation.",
+        "solution": "This API provides well-structured endpoints with automatic validation, clear documentation, and scalable architecture.",
+        "value_proposition": "Enables reliable data exchange and integration with comprehensive API documentation and testing tools.",
+        "target_users": "Backend developers, API consumers, and integration teams.",
+        "future_plans": "Expanding API endpoints and improving performance optimization."
+    },
+    "library": {
+        "problem": "Developers need reusable, well-tested libraries that solve common problems without adding unnecessary complexity.",
+        "solution": "This library provides clean APIs, comprehensive documentation, and thorough testing for reliable integration.",
+        "value_proposition": "Accelerates development by providing tested, reusable components with clear documentation.",
+        "target_users": "Software developers and engineering teams building applications.",
+        "future_plans": "Adding new features and maintaining backward compatibility."
+    },
+}
+
+_DEFAULT_INSIGHTS = {
+    "problem": "This project addresses specific technical challenges in its domain with innovative solutions.",
+    "solution": "Implements comprehensive functionality using modern development practices and proven patterns.",
+    "value_proposition": "Provides reliable, efficient solutions that improve productivity and code quality.",
+    "target_users": "Developers, engineers, and technical professionals in the relevant domain.",
+    "future_plans": "Expanding capabilities and improving user experience based on community feedback."
+}
+
+# Keyword groups mapped to feature labels; one data-driven pass replaces
+# a ladder of independent substring checks in _analyze_content.
+_FEATURE_KEYWORDS = (
+    (("test", "spec"), "Comprehensive testing suite"),
+    (("docker",), "Containerized deployment"),
+    (("api", "endpoint"), "RESTful API design"),
+    (("react", "vue", "angular"), "Modern frontend framework"),
+    (("typescript",), "Type-safe development"),
+    (("auth", "login"), "Authentication system"),
+    (("database", "db"), "Database integration"),
+)
+
+# One compiled alternation covering every feature and focus keyword, so a
+# single finditer pass over the content replaces a substring scan per
+# keyword. No word boundaries: like the old `in` checks, keywords should
+# match inside larger words ("auth" in "authentication"), and longer
+# alternatives precede their prefixes ("database" before "db").
+_CONTENT_KW_PATTERN = re.compile(
+    "|".join((
+        "test", "spec", "docker", "api", "endpoint", "react", "vue", "angular",
+        "typescript", "auth", "login", "database", "db",
+        "todo", "fixme", "beta", "alpha", "v1", "release",
+    )),
+    re.IGNORECASE,
+)
 
 
 class SimpleLLMReasoningEngine(ReasoningEngine):
     """Simple rule-based reasoning engine that mimics LLM behavior."""
-    
+
     def reason(self, signals: TechnicalSignals, content: str) -> Insights:
         """Generate insights using rule-based analysis."""
-        
+        # Truncate once up front so the keyword scan is O(1) in repo size
+        content = content[:_CONTENT_SCAN_CAP]
+
         # Analyze project type and generate specific insights
         project_insights = self._analyze_project_type(signals)
         content_insights = self._analyze_content(content)
@@ -167,77 +369,21 @@ class SimpleLLMReasoningEngine(ReasoningEngine):
     
     def _analyze_project_type(self, signals: TechnicalSignals) -> dict:
         """Generate insights based on project type."""
-        
-        if signals.project_type.value == "web_app":
-            return {
-                "problem": "Building modern web applications requires managing complex frontend and backend interactions, state management, and user experience optimization.",
-                "solution": "This web application provides a streamlined architecture with modern frameworks and best practices for scalable development.",
-                "value_proposition": "Delivers fast, responsive user experiences with maintainable code architecture.",
-                "target_users": "Web developers, frontend engineers, and product teams building user-facing applications.",
-                "future_plans": "Expanding cross-platform support and adding advanced user interface components."
-            }
-        elif signals.project_type.value == "cli":
-            return {
-                "problem": "Developers need efficient command-line tools that are easy to use, well-documented, and integrate seamlessly into existing workflows.",
-                "solution": "This CLI tool provides intuitive commands with comprehensive help documentation and robust error handling.",
-                "value_proposition": "Streamlines development workflows and automates repetitive tasks with reliable command-line interface.",
-                "target_users": "Software developers, DevOps engineers, and system administrators.",
-                "future_plans": "Adding more automation features and improving cross-platform compatibility."
-            }
-        elif signals.project_type.value == "api":
-            return {
-                "problem": "Creating robust APIs requires careful design of endpoints, data validation, authentication, and comprehensive documentation.",
-                "solution": "This API provides well-structured endpoints with automatic validation, clear documentation, and scalable architecture.",
-                "value_proposition": "Enables reliable data exchange and integration with comprehensive API documentation and testing tools.",
-                "target_users": "Backend developers, API consumers, and integration teams.",
-                "future_plans": "Expanding API endpoints and improving performance optimization."
-            }
-        elif signals.project_type.value == "library":
-            return {
-                "problem": "Developers need reusable, well-tested libraries that solve common problems without adding unnecessary complexity.",
-                "solution": "This library provides clean APIs, comprehensive documentation, and thorough testing for reliable integration.",
-                "value_proposition": "Accelerates development by providing tested, reusable components with clear documentation.",
-                "target_users": "Software developers and engineering teams building applications.",
-                "future_plans": "Adding new features and maintaining backward compatibility."
-            }
-        else:
-            return {
-                "problem": "This project addresses specific technical challenges in its domain with innovative solutions.",
-                "solution": "Implements comprehensive functionality using modern development practices and proven patterns.",
-                "value_proposition": "Provides reliable, efficient solutions that improve productivity and code quality.",
-                "target_users": "Developers, engineers, and technical professionals in the relevant domain.",
-                "future_plans": "Expanding capabilities and improving user experience based on community feedback."
-            }
+        return _PROJECT_INSIGHTS.get(signals.project_type.value, _DEFAULT_INSIGHTS)
     
     def _analyze_content(self, content: str) -> dict:
         """Analyze repository content for additional insights."""
-        content_lower = content.lower()
-        
-        features = []
+        # Single case-insensitive pass collects every keyword hit at once
+        hits = {match.group(0).lower() for match in _CONTENT_KW_PATTERN.finditer(content)}
+
         current_focus = "Improving core functionality and user experience."
-        
+
         # Detect common features from content
-        if "test" in content_lower or "spec" in content_lower:
-            features.append("Comprehensive testing suite")
-        
-        if "docker" in content_lower:
-            features.append("Containerized deployment")
-        
-        if "api" in content_lower or "endpoint" in content_lower:
-            features.append("RESTful API design")
-        
-        if "react" in content_lower or "vue" in content_lower or "angular" in content_lower:
-            features.append("Modern frontend framework")
-        
-        if "typescript" in content_lower:
-            features.append("Type-safe development")
-        
-        if "auth" in content_lower or "login" in content_lower:
-            features.append("Authentication system")
-        
-        if "database" in content_lower or "db" in content_lower:
-            features.append("Database integration")
-        
+        features = [
+            label for keywords, label in _FEATURE_KEYWORDS
+            if not hits.isdisjoint(keywords)
+        ]
+
         # Default features if none detected
         if not features:
             features = [
@@ -246,15 +392,15 @@ class SimpleLLMReasoningEngine(ReasoningEngine):
                 "User-friendly interface",
                 "Reliable performance"
             ]
-        
+
         # Analyze current focus based on recent activity indicators
-        if "todo" in content_lower or "fixme" in content_lower:
+        if "todo" in hits or "fixme" in hits:
             current_focus = "Addressing technical debt and implementing planned improvements."
-        elif "beta" in content_lower or "alpha" in content_lower:
+        elif "beta" in hits or "alpha" in hits:
             current_focus = "Stabilizing features and preparing for production release."
-        elif "v1" in content_lower or "release" in content_lower:
+        elif "v1" in hits or "release" in hits:
             current_focus = "Finalizing features and ensuring production readiness."
-        
+
         return {
             "features": features[:5],  # Limit to 5 features
             "current_focus": current_focus
@@ -4,9 +4,14 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Insights:
-    """AI-generated insights about the project."""
+    """AI-generated insights about the project.
+
+    A value object: engines produce it once and consumers only read it,
+    so it is frozen and slotted. key_features stays a List for caller
+    compatibility; treat it as read-only.
+    """
     problem: str
     solution: str
     value_proposition: str
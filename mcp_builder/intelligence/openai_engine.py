@@ -1,21 +1,107 @@
 """OpenAI-powered reasoning engine."""
 
+import asyncio
+import hashlib
 import json
 import logging
+from pathlib import Path
 from typing import Optional
 
 try:
-    import openai
-    OPENAI_AVAILABLE = True
+    import diskcache
+    DISKCACHE_AVAILABLE = True
 except ImportError:
-    OPENAI_AVAILABLE = False
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .base import ReasoningEngine
 from .models import Insights
+from ._rate_limiter import RateLimiter
 from ..analyzers.models import TechnicalSignals
 
 logger = logging.getLogger(__name__)
 
+# The openai SDK import costs hundreds of milliseconds (httpx, pydantic
+# machinery), so it is deferred until an engine is actually constructed
+# rather than paid on every CLI invocation.
+_openai = None
+
+
+def _require_openai():
+    """Import the openai SDK on first use and memoize the module."""
+    global _openai
+    if _openai is None:
+        try:
+            import openai
+        except ImportError:
+            raise ImportError("OpenAI package not installed. Run: pip install openai")
+        _openai = openai
+    return _openai
+
+
+# Parsed responses cached on disk keyed by model and prompt digest;
+# identical prompts (same repo, same signals) skip the API round trip.
+_RESPONSE_CACHE_DIR = Path.home() / ".cache" / "mcp-builder" / "openai"
+_RESPONSE_TTL_SECONDS = 7 * 86400
+
+# Completion-token ceiling for batched calls; gpt-4o-mini (the default
+# model) caps output at 16384 tokens and the API rejects requests above it
+_MAX_COMPLETION_TOKENS = 16384
+
+# Insight fields expected from the model, shared by the single and batch
+# system prompts.
+_SCHEMA_BLOCK = """{
+    "problem": "What specific problem does this project solve? (1-2 sentences)",
+    "solution": "How does this project solve the problem? (1-2 sentences)",
+    "value_proposition": "What value does this provide to users? (1-2 sentences)",
+    "target_users": "Who are the primary users of this project? (1 sentence)",
+    "key_features": ["List 3-5 key features as short phrases"],
+    "current_focus": "What is the current development focus? (1 sentence)",
+    "future_plans": "What are likely future plans for this project? (1 sentence)"
+}"""
+
+# Static instructions and JSON schema, sent first and byte-identical on
+# every call so the provider's automatic prefix caching can reuse its KV
+# cache; only the per-repo signals and content vary, and they come last.
+_SYSTEM_PREFIX = f"""You are an expert software analyst. Analyze the provided repository information and generate structured insights.
+
+Respond with a JSON object containing:
+{_SCHEMA_BLOCK}
+
+Base your analysis on the actual code, documentation, and project structure. Be specific and accurate.
+Respond with only the JSON object, no additional text."""
+
+# Batch variant: one call covers several repositories and returns one
+# insight object per repository, wrapped so json_object mode applies.
+_BATCH_SYSTEM_PREFIX = f"""You are an expert software analyst. Analyze each numbered repository in the provided information and generate structured insights.
+
+Respond with a JSON object of the form {{"repositories": [...]}} containing exactly one object per repository, in input order. Each object must contain:
+{_SCHEMA_BLOCK}
+
+Base your analysis on the actual code, documentation, and project structure. Be specific and accurate.
+Respond with only the JSON object, no additional text."""
+
+# System turns built once so every call reuses the same message object
+# instead of re-allocating the dict (and its content string) per request.
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PREFIX}
+_BATCH_SYSTEM_MSG = {"role": "system", "content": _BATCH_SYSTEM_PREFIX}
+
+# Per-repo suffix bound once at import; _build_prompt only fills the slots
+_USER_TEMPLATE = """TECHNICAL SIGNALS:
+- Languages: {languages}
+- Frameworks: {frameworks}
+- Project Type: {project_type}
+- Maturity: {maturity}
+- Activity Level: {activity_level}
+
+REPOSITORY CONTENT (first 8000 chars):
+{content}"""
+
 
 class OpenAIReasoningEngine(ReasoningEngine):
     """OpenAI GPT-powered reasoning engine for generating project insights."""
@@ -27,100 +113,143 @@ class OpenAIReasoningEngine(ReasoningEngine):
             api_key: OpenAI API key (if None, uses environment variable)
             model: OpenAI model to use
         """
-        if not OPENAI_AVAILABLE:
-            raise ImportError("OpenAI package not installed. Run: pip install openai")
-        
+        # Raises ImportError here if the SDK is missing
+        openai = _require_openai()
+
         self.client = openai.OpenAI(api_key=api_key)
         self.model = model
-    
+        self._cache = (
+            diskcache.Cache(str(_RESPONSE_CACHE_DIR)) if DISKCACHE_AVAILABLE else None
+        )
+
     def reason(self, signals: TechnicalSignals, content: str) -> Insights:
         """Generate insights using OpenAI GPT."""
         try:
             prompt = self._build_prompt(signals, content)
-            
+
+            cache_key = None
+            if self._cache is not None:
+                digest_input = f"{self.model}|{prompt}".encode()
+                cache_key = hashlib.blake2b(digest_input, digest_size=16).hexdigest()
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached OpenAI response")
+                    return cached
+
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert software analyst. Analyze the provided repository information and generate structured insights in JSON format."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
+                messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
                 temperature=0.3,
-                max_tokens=2000
+                max_tokens=2000,
+                response_format={"type": "json_object"}
             )
-            
+
+            self._log_cache_usage(response)
             result = response.choices[0].message.content
-            return self._parse_response(result)
+            insights = self._parse_response(result)
+            if cache_key is not None:
+                self._cache.set(cache_key, insights, expire=_RESPONSE_TTL_SECONDS)
+            return insights
             
         except Exception as e:
             logger.error(f"OpenAI reasoning failed: {e}")
             # Fallback to mock insights
             return self._fallback_insights()
     
-    def _build_prompt(self, signals: TechnicalSignals, content: str) -> str:
-        """Build the analysis prompt."""
-        return f"""
-Analyze this software repository and provide structured insights.
+    def reason_batch(self, items: list) -> list:
+        """Reason over (signals, content) pairs in one API call.
 
-TECHNICAL SIGNALS:
-- Languages: {', '.join(signals.languages)}
-- Frameworks: {', '.join(signals.frameworks)}
-- Project Type: {signals.project_type.value}
-- Maturity: {signals.maturity.value}
-- Activity Level: {signals.activity_level}
+        The per-call overhead (round trip, request accounting, repeated
+        system prompt) is identical across a fleet of repositories, so
+        packing K of them into one request amortizes it K ways. Content
+        is split evenly across the usual 8000-char budget to stay within
+        context.
 
-REPOSITORY CONTENT (first 8000 chars):
-{content[:8000]}
+        Args:
+            items: Sequence of (TechnicalSignals, content) tuples
 
-Please analyze this repository and respond with a JSON object containing:
-{{
-    "problem": "What specific problem does this project solve? (1-2 sentences)",
-    "solution": "How does this project solve the problem? (1-2 sentences)", 
-    "value_proposition": "What value does this provide to users? (1-2 sentences)",
-    "target_users": "Who are the primary users of this project? (1 sentence)",
-    "key_features": ["List 3-5 key features as short phrases"],
-    "current_focus": "What is the current development focus? (1 sentence)",
-    "future_plans": "What are likely future plans for this project? (1 sentence)"
-}}
+        Returns:
+            Insights in the same order as the input items
+        """
+        if not items:
+            return []
 
-Base your analysis on the actual code, documentation, and project structure. Be specific and accurate.
-"""
+        try:
+            per_repo_budget = max(1000, 8000 // len(items))
+            sections = [
+                f"--- REPOSITORY {i} ---\n"
+                + self._build_prompt(signals, content[:per_repo_budget])
+                for i, (signals, content) in enumerate(items)
+            ]
+            prompt = "\n\n".join(sections)
+
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[_BATCH_SYSTEM_MSG, {"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=min(2000 * len(items), _MAX_COMPLETION_TOKENS),
+                response_format={"type": "json_object"}
+            )
+
+            self._log_cache_usage(response)
+            result = response.choices[0].message.content
+            data = orjson.loads(result) if ORJSON_AVAILABLE else json.loads(result)
+            entries = data.get("repositories", []) if isinstance(data, dict) else data
+
+            insights = []
+            for i in range(len(items)):
+                entry = entries[i] if i < len(entries) and isinstance(entries[i], dict) else {}
+                insights.append(self._insights_from_data(entry))
+            return insights
+
+        except Exception as e:
+            logger.error(f"OpenAI batch reasoning failed: {e}")
+            return [self._fallback_insights() for _ in items]
+
+    @staticmethod
+    def _log_cache_usage(response) -> None:
+        """Log provider-side prompt-cache hits when the API reports them."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None)
+        if cached:
+            logger.debug(f"Prompt cache hit: {cached} input tokens reused")
+
+    def _build_prompt(self, signals: TechnicalSignals, content: str) -> str:
+        """Build the variable per-repo part of the prompt."""
+        return _USER_TEMPLATE.format_map({
+            "languages": signals.languages_csv,
+            "frameworks": signals.frameworks_csv,
+            "project_type": signals.project_type.value,
+            "maturity": signals.maturity.value,
+            "activity_level": signals.activity_level,
+            "content": content[:8000],
+        })
     
     def _parse_response(self, response: str) -> Insights:
         """Parse OpenAI response into Insights object."""
         try:
-            # Extract JSON from response (handle markdown code blocks)
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-            else:
-                json_str = response.strip()
-            
-            data = json.loads(json_str)
-            
-            return Insights(
-                problem=data.get("problem", "Project addresses domain-specific challenges."),
-                solution=data.get("solution", "Implements comprehensive solution using modern practices."),
-                value_proposition=data.get("value_proposition", "Provides efficiency and reliability benefits."),
-                target_users=data.get("target_users", "Developers and technical professionals."),
-                key_features=data.get("key_features", ["Modern architecture", "Easy to use", "Well documented"]),
-                current_focus=data.get("current_focus", "Improving core functionality and user experience."),
-                future_plans=data.get("future_plans", "Expanding features and community adoption.")
-            )
-            
-        except (json.JSONDecodeError, KeyError) as e:
+            # response_format guarantees a bare JSON object, so no
+            # markdown-fence scanning or substring slicing is needed
+            data = orjson.loads(response) if ORJSON_AVAILABLE else json.loads(response)
+            return self._insights_from_data(data)
+
+        except (ValueError, KeyError) as e:
             logger.warning(f"Failed to parse OpenAI response: {e}")
             return self._fallback_insights()
+
+    @staticmethod
+    def _insights_from_data(data: dict) -> Insights:
+        """Build Insights from one decoded response object."""
+        return Insights(
+            problem=data.get("problem", "Project addresses domain-specific challenges."),
+            solution=data.get("solution", "Implements comprehensive solution using modern practices."),
+            value_proposition=data.get("value_proposition", "Provides efficiency and reliability benefits."),
+            target_users=data.get("target_users", "Developers and technical professionals."),
+            key_features=data.get("key_features", ["Modern architecture", "Easy to use", "Well documented"]),
+            current_focus=data.get("current_focus", "Improving core functionality and user experience."),
+            future_plans=data.get("future_plans", "Expanding features and community adoption.")
+        )
     
     def _fallback_insights(self) -> Insights:
         """Fallback insights when AI fails."""
@@ -137,4 +266,133 @@ Base your analysis on the actual code, documentation, and project structure. Be
             ],
             current_focus="Enhancing core features and improving documentation.",
             future_plans="Expanding capabilities and growing the user community."
-        )
\ No newline at end of file
+        )
+
+def _make_http2_client():
+    """Build an HTTP/2 httpx client for the async engine, if available.
+
+    HTTP/2 multiplexes concurrent completions over one TLS connection
+    instead of serializing handshakes through an HTTP/1.1 pool. Needs the
+    http2 extra (httpx[http2]); returns None to use the SDK default pool
+    when h2 is not installed.
+    """
+    try:
+        import httpx
+        return httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=100))
+    except ImportError:
+        return None
+
+
+class AsyncOpenAIReasoningEngine(OpenAIReasoningEngine):
+    """Async OpenAI engine that fans reasoning calls out concurrently.
+
+    Reasoning over N repositories is latency-bound on the API round trip;
+    scheduling the calls with asyncio.gather under a semaphore brings wall
+    clock close to the slowest single call instead of the sum.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini",
+                 max_concurrency: int = 8, rate_limiter: Optional[RateLimiter] = None):
+        """Initialize async OpenAI reasoning engine.
+
+        Args:
+            api_key: OpenAI API key (if None, uses environment variable)
+            model: OpenAI model to use
+            max_concurrency: Maximum in-flight API calls (guards against 429s)
+            rate_limiter: Optional RateLimiter pacing requests below the
+                account's RPM/TPM limits
+        """
+        super().__init__(api_key=api_key, model=model)
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self._http_client = _make_http2_client()
+        self._aclient = _require_openai().AsyncOpenAI(api_key=api_key, http_client=self._http_client)
+
+    async def aclose(self) -> None:
+        """Release the underlying HTTP connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncOpenAIReasoningEngine":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def reason_async(self, signals: TechnicalSignals, content: str) -> Insights:
+        """Generate insights using OpenAI GPT without blocking."""
+        try:
+            prompt = self._build_prompt(signals, content)
+
+            cache_key = None
+            if self._cache is not None:
+                digest_input = f"{self.model}|{prompt}".encode()
+                cache_key = hashlib.blake2b(digest_input, digest_size=16).hexdigest()
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached OpenAI response")
+                    return cached
+
+            if self.rate_limiter is not None:
+                # Rough input estimate at ~4 chars/token plus the output cap
+                await self.rate_limiter.acquire(len(prompt) // 4 + 2000)
+
+            # Streaming lets the event loop interleave many in-flight
+            # generations chunk by chunk instead of parking each task
+            # until its full 2000-token response has been buffered. The
+            # raw-response wrapper exposes the rate-limit headers.
+            raw = await self._aclient.chat.completions.with_raw_response.create(
+                model=self.model,
+                messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=2000,
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+
+            if self.rate_limiter is not None:
+                # Clamp the local bucket to the server's view of what is
+                # left, so pacing never runs ahead of the API
+                self.rate_limiter.sync_remaining(
+                    raw.headers.get("x-ratelimit-remaining-requests"),
+                    raw.headers.get("x-ratelimit-remaining-tokens"),
+                )
+
+            stream = raw.parse()
+
+            parts = []
+            async for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                elif chunk.usage is not None:
+                    # Final chunk carries the usage payload
+                    self._log_cache_usage(chunk)
+
+            insights = self._parse_response("".join(parts))
+            if cache_key is not None:
+                self._cache.set(cache_key, insights, expire=_RESPONSE_TTL_SECONDS)
+            return insights
+
+        except Exception as e:
+            logger.error(f"OpenAI reasoning failed: {e}")
+            return self._fallback_insights()
+
+    async def reason_many(self, jobs: list) -> list:
+        """Reason over (signals, content) pairs concurrently.
+
+        Args:
+            jobs: Sequence of (TechnicalSignals, content) tuples
+
+        Returns:
+            Insights in the same order as the input jobs
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(signals: TechnicalSignals, content: str) -> Insights:
+            async with semaphore:
+                return await self.reason_async(signals, content)
+
+        return list(await asyncio.gather(*(bounded(s, c) for s, c in jobs)))
@@ -1,27 +1,102 @@
 """Content selection for reasoning."""
 
+import io
+from typing import Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 from ..ingestion.models import RepositorySnapshot
 
+# Encoders are expensive to construct (BPE table load), so one instance
+# per encoding name is shared across calls.
+_ENCODINGS: dict = {}
+
+
+def _get_encoding(name: str):
+    """Return the shared tiktoken encoding for this name."""
+    encoding = _ENCODINGS.get(name)
+    if encoding is None:
+        encoding = _ENCODINGS[name] = tiktoken.get_encoding(name)
+    return encoding
 
-def select_content(snapshot: RepositorySnapshot, max_length: int = 10000) -> str:
+
+def select_content(snapshot: RepositorySnapshot, max_length: int = 10000,
+                   max_tokens: Optional[int] = None,
+                   encoding: str = "o200k_base") -> str:
     """Select and concatenate high-priority content for reasoning.
 
+    Files arrive already sorted by priority (see collect_files), so the
+    budget is spent on the highest-signal content first. Writing straight
+    into a StringIO with an early break avoids materializing a list of
+    file bodies alongside the joined result.
+
+    Providers bill and clip by tokens, and characters-per-token varies
+    severalfold across languages and code, so when max_tokens is given
+    (and tiktoken is installed) the budget is measured in tokens of the
+    given encoding instead of characters.
+
     Args:
         snapshot: Repository snapshot
-        max_length: Maximum content length
+        max_length: Maximum content length in characters
+        max_tokens: Maximum content length in tokens; takes precedence
+            over max_length when tiktoken is available
+        encoding: tiktoken encoding name used for the token budget
 
     Returns:
         Concatenated content string
     """
-    content_parts = []
-    total_length = 0
+    if not snapshot.files:
+        return ""
+
+    if max_tokens is not None and TIKTOKEN_AVAILABLE:
+        return _select_by_tokens(snapshot, max_tokens, encoding)
+
+    if max_length <= 0:
+        return ""
+
+    buffer = io.StringIO()
+    remaining = max_length
+
+    for file in snapshot.files:
+        if buffer.tell():
+            # Separators count against the budget too; stop before writing
+            # one that no content could follow
+            if remaining <= 2:
+                break
+            buffer.write("\n\n")
+            remaining -= 2
+        content = file.content
+        if len(content) >= remaining:
+            buffer.write(content[:remaining])
+            break
+        buffer.write(content)
+        remaining -= len(content)
+
+    return buffer.getvalue()
+
+
+def _select_by_tokens(snapshot: RepositorySnapshot, max_tokens: int, encoding: str) -> str:
+    """Concatenate priority-ordered content up to a token budget."""
+    enc = _get_encoding(encoding)
+    buffer = io.StringIO()
+    written = 0
 
     for file in snapshot.files:
-        if total_length + len(file.content) > max_length:
-            remaining = max_length - total_length
-            content_parts.append(file.content[:remaining])
+        room = max_tokens - written
+        if room <= 0:
             break
-        content_parts.append(file.content)
-        total_length += len(file.content)
+        tokens = enc.encode(file.content, disallowed_special=())
+        if written:
+            buffer.write("\n\n")
+        if len(tokens) > room:
+            buffer.write(enc.decode(tokens[:room]))
+            written += room
+        else:
+            buffer.write(file.content)
+            written += len(tokens)
 
-    return "\n\n".join(content_parts)
\ No newline at end of file
+    return buffer.getvalue()
@@ -1,12 +1,20 @@
 """MCP YAML generation."""
 
 import logging
-from datetime import datetime
+import re
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+# libyaml's C emitter/parser is several times faster than the pure-Python
+# default; fall back silently when PyYAML was built without it.
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 from .schemas import MCP, Metadata
 from ..analyzers.models import TechnicalSignals
 from ..ingestion.models import RepositorySnapshot
@@ -14,15 +22,19 @@ from ..intelligence.models import Insights
 
 logger = logging.getLogger(__name__)
 
+# First markdown H1 in a README header; a bounded regex scan replaces
+# splitting every line of a possibly large file to inspect the top few.
+_H1_PATTERN = re.compile(r"(?m)^\s*#\s+(.+)$")
+_README_HEAD_BYTES = 2048
+
 
 def infer_project_name(snapshot: RepositorySnapshot) -> str:
     """Infer project name from README or directory name."""
-    for file in snapshot.files:
-        if 'readme' in file.path.name.lower():
-            lines = file.content.split('\n')
-            for line in lines[:10]:
-                if line.strip().startswith('# '):
-                    return line[2:].strip()
+    readme = snapshot.readme
+    if readme is not None:
+        match = _H1_PATTERN.search(readme.content[:_README_HEAD_BYTES])
+        if match:
+            return match.group(1).strip()
     return snapshot.root_path.name
 
 
@@ -31,14 +43,27 @@ def generate_one_liner(insights: Insights) -> str:
     return insights.value_proposition[:200] + "..." if len(insights.value_proposition) > 200 else insights.value_proposition
 
 
-def generate_mcp(snapshot: RepositorySnapshot, signals: TechnicalSignals, insights: Insights, version: str = "1.0") -> MCP:
-    """Generate MCP object from extracted data."""
+def generate_mcp(snapshot: RepositorySnapshot, signals: TechnicalSignals, insights: Insights,
+                 version: str = "1.0", *, now: Optional[datetime] = None,
+                 validate: bool = False) -> MCP:
+    """Generate MCP object from extracted data.
+
+    Every field here is built internally from already-validated models,
+    so model_construct skips pydantic validation — the dominant cost of
+    building this many-field model in batch runs. Pass validate=True to
+    force full validation; pass now to share one timestamp (and skip a
+    clock syscall per repo) across a batch.
+    """
     project_name = infer_project_name(snapshot)
     one_liner = generate_one_liner(insights)
 
-    metadata = Metadata(version=version)
+    metadata = Metadata.model_construct(
+        version=version,
+        generated_at=now if now is not None else datetime.now(timezone.utc),
+    )
 
-    return MCP(
+    builder = MCP if validate else MCP.model_construct
+    return builder(
         project_name=project_name,
         one_liner=one_liner,
         problem=insights.problem,
@@ -58,22 +83,20 @@ def generate_mcp(snapshot: RepositorySnapshot, signals: TechnicalSignals, insigh
 
 def save_mcp(mcp: MCP, output_path: Path) -> None:
     """Save MCP to YAML file."""
-    data = mcp.model_dump()
-    # Ensure enums are serialized as strings
-    if 'project_type' in data and hasattr(data['project_type'], 'value'):
-        data['project_type'] = data['project_type'].value
-    if 'status' in data and hasattr(data['status'], 'value'):
-        data['status'] = data['status'].value
+    # mode="json" emits primitives (enum values, ISO datetimes) directly,
+    # so no manual enum patching and no slow YAML object representers
+    data = mcp.model_dump(mode="json")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False,
+                  allow_unicode=True)
     logger.info(f"MCP saved to {output_path}")
 
 
 def load_mcp(file_path: Path) -> MCP:
     """Load MCP from YAML file."""
     with open(file_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
     return MCP(**data)
 
 
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProjectType(str, Enum):
@@ -27,12 +27,18 @@ class ProjectStatus(str, Enum):
 
 class Metadata(BaseModel):
     """Metadata for MCP YAML."""
+    # Value object: frozen skips per-instance mutability machinery, and
+    # ignoring unknown keys keeps loads of newer files cheap and lenient
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     version: str = Field(..., description="Version of the MCP schema")
     generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Timestamp of generation")
 
 
 class MCP(BaseModel):
     """Main MCP YAML schema."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     project_name: str = Field(..., description="Name of the project")
     one_liner: str = Field(..., description="Brief one-line description")
     problem: str = Field(..., description="Problem the project solves")
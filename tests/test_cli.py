@@ -0,0 +1,48 @@
+"""Tests for the CLI commands."""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from mcp_builder.cli.main import app
+
+runner = CliRunner()
+
+
+def _make_repo(tmp_path: Path, name: str) -> Path:
+    """Create a minimal local repository under tmp_path."""
+    repo = tmp_path / name
+    repo.mkdir()
+    (repo / "README.md").write_text(f"# {name}\n\nA test repository.")
+    (repo / "main.py").write_text("print('hello world')")
+    return repo
+
+
+def test_batch_success(tmp_path):
+    """Test batch generation writes an MCP file per repository."""
+    repos = [_make_repo(tmp_path, name) for name in ("repo-a", "repo-b")]
+
+    result = runner.invoke(app, ["batch", *map(str, repos), "--ai-provider", "mock"])
+
+    assert result.exit_code == 0
+    for repo in repos:
+        assert (repo / "mcp.yaml").exists()
+
+
+def test_batch_failure_exits_nonzero(tmp_path):
+    """Test batch exits non-zero when a repository fails."""
+    repo = _make_repo(tmp_path, "repo-a")
+    missing = tmp_path / "does-not-exist"
+
+    result = runner.invoke(
+        app, ["batch", str(repo), str(missing), "--ai-provider", "mock"]
+    )
+
+    assert result.exit_code == 1
+    # The failing repository must not take the healthy one down with it
+    assert (repo / "mcp.yaml").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,7 +1,9 @@
 """Tests for GitHub integration functionality."""
 
+import json
 import os
 import pytest
+import requests
 from unittest.mock import Mock, patch
 
 from mcp_builder.github.client import GitHubClient
@@ -46,7 +48,7 @@ def test_github_client_get_repository(mock_get):
     # Mock API response
     mock_response = Mock()
     mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {
+    payload = {
         "name": "test-repo",
         "full_name": "owner/test-repo",
         "description": "A test repository",
@@ -67,6 +69,8 @@ def test_github_client_get_repository(mock_get):
         "archived": False,
         "disabled": False,
     }
+    mock_response.json.return_value = payload
+    mock_response.content = json.dumps(payload).encode()
     mock_get.return_value = mock_response
     
     client = GitHubClient("fake-token")
@@ -80,7 +84,83 @@ def test_github_client_get_repository(mock_get):
     assert "python" in repo.topics
 
 
-@patch('mcp_builder.github.cloner.git.Repo.clone_from')
+@patch('mcp_builder.github.client.requests.Session.get')
+def test_github_client_get_contributors_pagination(mock_get):
+    """Test contributor fetching across multiple Link-header pages."""
+    def page_response(entries, next_url=None):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        payload = [
+            {"login": login, "contributions": contributions, "type": "User"}
+            for login, contributions in entries
+        ]
+        response.json.return_value = payload
+        response.content = json.dumps(payload).encode()
+        response.links = {"next": {"url": next_url}} if next_url else {}
+        return response
+
+    mock_get.side_effect = [
+        page_response(
+            [("user1", 50), ("user2", 30)],
+            next_url="https://api.github.com/repositories/1/contributors?page=2",
+        ),
+        page_response([("user3", 10)]),
+    ]
+
+    client = GitHubClient("fake-token")
+    contributors = client.get_contributors("owner", "test-repo")
+
+    assert [c.login for c in contributors] == ["user1", "user2", "user3"]
+    assert mock_get.call_count == 2
+    # The second request must follow the Link: rel="next" URL
+    assert mock_get.call_args_list[1].args[0].endswith("page=2")
+
+
+@patch('mcp_builder.github.client.requests.Session.get')
+def test_github_client_count_contributors(mock_get):
+    """Test counting contributors via the Link rel="last" page number."""
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.links = {
+        "last": {"url": "https://api.github.com/repos/owner/test-repo/contributors?per_page=1&page=42"}
+    }
+    mock_get.return_value = response
+
+    client = GitHubClient("fake-token")
+    assert client.count_contributors("owner", "test-repo") == 42
+
+    # Single page of results: no rel="last", the body length is the count
+    payload = [{"login": "user1", "contributions": 5, "type": "User"}]
+    response.links = {}
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    assert client.count_contributors("owner", "test-repo") == 1
+
+
+@patch('mcp_builder.github.client.requests.Session.get')
+def test_github_client_empty_body_degrades(mock_get):
+    """Test that an empty response body yields the documented safe defaults.
+
+    GitHub returns 204 with no body for an empty repository's /contributors,
+    which must degrade like any other request failure.
+    """
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.content = b""
+    response.json.side_effect = requests.exceptions.JSONDecodeError(
+        "Expecting value", "", 0
+    )
+    response.links = {}
+    mock_get.return_value = response
+
+    client = GitHubClient("fake-token")
+    assert client.get_contributors("owner", "test-repo") == []
+    assert client.count_contributors("owner", "test-repo") == 0
+    assert client.get_language_stats("owner", "test-repo").total_bytes == 0
+    assert client.check_rate_limit() == {}
+
+
+@patch('mcp_builder.github.cloner.subprocess.run')
 @patch('mcp_builder.github.cloner.tempfile.mkdtemp')
 def test_github_repository_ingestion(mock_mkdtemp, mock_clone, tmp_path):
     """Test ingesting a GitHub repository."""
@@ -102,6 +182,7 @@ def test_github_repository_ingestion(mock_mkdtemp, mock_clone, tmp_path):
     
     with patch('mcp_builder.ingestion.walker.ingest_local_repository') as mock_ingest:
         mock_snapshot = Mock()
+        mock_snapshot.files = []
         mock_snapshot.github_url = None
         mock_snapshot.is_github_clone = False
         mock_ingest.return_value = mock_snapshot